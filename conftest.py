@@ -0,0 +1,10 @@
+"""
+pytest configuration
+Puts src/ on the import path once for every test module
+"""
+import os
+import sys
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src')
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
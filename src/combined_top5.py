@@ -4,7 +4,6 @@ Aggregates Top 5 symbols from all auto-run scans and provides visualization
 """
 import streamlit as st
 import pandas as pd
-import matplotlib.pyplot as plt
 import numpy as np
 import yfinance as yf
 from typing import Callable, Dict, List, Optional
@@ -64,6 +63,8 @@ def render_combined_top5_plot(default_lookback: int = 60):
     Args:
         default_lookback: Number of days to show in the plot (default: 60)
     """
+    import matplotlib.pyplot as plt  # only loaded once the plot is shown
+
     st.markdown("---")
     st.markdown("### 📊 Combined Top 5 Visualization")
     
@@ -42,32 +42,13 @@ def clean_symbols(symbols) -> List[str]:
     
     # Handle string input: split on commas to avoid character-level iteration
     if isinstance(symbols, str):
-        symbols = [s.strip() for s in symbols.split(',')]
+        symbols = symbols.split(',')
     
-    cleaned = []
-    seen = set()
+    # Strip whitespace and convert to uppercase, skipping non-string entries
+    normalized = (symbol.strip().upper() for symbol in symbols if isinstance(symbol, str))
     
-    for symbol in symbols:
-        # Skip non-string entries
-        if not isinstance(symbol, str):
-            continue
-            
-        # Strip whitespace and convert to uppercase
-        symbol = symbol.strip().upper()
-        
-        # Skip empty strings
-        if not symbol:
-            continue
-        
-        # Skip symbols with invalid characters
-        if not VALID_SYMBOL_PATTERN.match(symbol):
-            continue
-        
-        # Skip duplicates (preserve first occurrence order)
-        if symbol in seen:
-            continue
-        
-        seen.add(symbol)
-        cleaned.append(symbol)
-    
-    return cleaned
+    # Drop empty and invalid symbols; dict.fromkeys removes duplicates while
+    # preserving first occurrence order
+    return list(dict.fromkeys(
+        symbol for symbol in normalized if symbol and VALID_SYMBOL_PATTERN.match(symbol)
+    ))
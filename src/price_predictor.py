@@ -148,6 +148,65 @@ class PricePredictor:
             'daily_trend': round(trend_slope, 4)
         }
     
+    def predict_price_range_batch(self, hist_data: pd.DataFrame, end_indices,
+                                  current_prices=None) -> Dict[str, np.ndarray]:
+        """
+        Predict future price ranges as of several points in one history
+        
+        Equivalent to calling predict_price_range on hist_data.iloc[:i + 1] for
+        each end index i, but volatility and trend are computed in one pass over
+        the closes instead of once per slice (e.g. for walk-forward backtests).
+        
+        Args:
+            hist_data: Historical OHLCV data
+            end_indices: Positions of the last bar visible to each prediction
+            current_prices: Price to project from at each index (defaults to
+                            the close at that index)
+            
+        Returns:
+            Dictionary of arrays (one value per end index) with predicted_price,
+            price_low, price_high, confidence_80_low and confidence_80_high
+        """
+        closes = hist_data['Close'].to_numpy(dtype=np.float64)
+        idx = np.asarray(end_indices, dtype=np.intp)
+        if current_prices is None:
+            current = closes[idx]
+        else:
+            current = np.asarray(current_prices, dtype=np.float64)
+        lengths = idx + 1
+        sufficient = lengths >= 20
+        
+        # Volatility: std of every daily return in the slice (expanding window),
+        # default 20% annualized below 30 bars
+        returns = pd.Series(closes[1:] / closes[:-1] - 1)
+        expanding_std = returns.expanding(min_periods=2).std().to_numpy()
+        daily_vol = np.full(idx.shape, 0.20 / np.sqrt(252))
+        has_vol = lengths >= 30
+        daily_vol[has_vol] = expanding_std[lengths[has_vol] - 2]
+        
+        # Trend: least-squares slope over the last 20 closes of each slice
+        # (histories shorter than that only have fallback predictions)
+        if closes.size >= 20:
+            x = np.arange(20) - 9.5
+            windows = closes[np.clip(idx, 19, None)[:, None] + np.arange(-19, 1)]
+            trend_slope = np.where(sufficient, windows @ (x / (x @ x)), 0.0)
+        else:
+            trend_slope = np.zeros(idx.shape)
+        
+        predicted_price = current + trend_slope * self.forecast_days
+        forecast_vol = daily_vol * np.sqrt(self.forecast_days)
+        
+        def banded(estimate, fallback):
+            return np.where(sufficient, np.round(estimate, 2), current * fallback)
+        
+        return {
+            'predicted_price': banded(predicted_price, 1.0),
+            'price_low': banded(np.maximum(0, predicted_price * (1 - 2 * forecast_vol)), 0.95),
+            'price_high': banded(predicted_price * (1 + 2 * forecast_vol), 1.05),
+            'confidence_80_low': banded(np.maximum(0, predicted_price * (1 - 1.28 * forecast_vol)), 0.97),
+            'confidence_80_high': banded(predicted_price * (1 + 1.28 * forecast_vol), 1.03),
+        }
+    
     def get_price_targets(self, current_price: float, prediction: Dict) -> Dict[str, float]:
         """
         Calculate price targets based on prediction
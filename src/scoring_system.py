@@ -8,6 +8,60 @@ from typing import Dict, List, Tuple
 import yfinance as yf
 from datetime import datetime, timedelta
 
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+
+def _ema(values: np.ndarray, span: int) -> np.ndarray:
+    """
+    Exponential moving average matching pandas ewm(span=span, adjust=False)
+
+    Args:
+        values: NaN-free float64 array
+        span: EMA span
+
+    Returns:
+        Array of EMA values
+    """
+    alpha = 2.0 / (span + 1.0)
+    out = np.empty_like(values)
+    if values.size == 0:
+        return out
+    out[0] = values[0]
+    for i in range(1, values.size):
+        out[i] = out[i - 1] + alpha * (values[i] - out[i - 1])
+    return out
+
+
+if HAS_NUMBA:
+    # Compiled once and cached on disk; a pandas ewm call costs more than the
+    # whole loop on screener-length series
+    _ema = njit(cache=True)(_ema)
+
+
+def _macd_arrays(prices: pd.Series):
+    """
+    Compute the 12/26/9 MACD chain with the compiled EMA kernel
+
+    Args:
+        prices: Series of closing prices
+
+    Returns:
+        Tuple of (MACD, Signal, Histogram) arrays, or None when numba is not
+        installed or the prices contain NaN (left to pandas' NaN handling)
+    """
+    if not HAS_NUMBA:
+        return None
+    closes = prices.to_numpy(dtype=np.float64)
+    if np.isnan(closes).any():
+        return None
+    macd = _ema(closes, 12) - _ema(closes, 26)
+    signal = _ema(macd, 9)
+    return macd, signal, macd - signal
+
 
 class StockScorer:
     """Score stocks based on technical indicators and probability of upward trend"""
@@ -45,7 +99,31 @@ class StockScorer:
         rsi = 100 - (100 / (1 + rs))
         
         return rsi.iloc[-1] if not pd.isna(rsi.iloc[-1]) else 50.0
-    
+
+    def calculate_rsi_series(self, prices: pd.Series, period: int = 14) -> pd.Series:
+        """
+        Calculate RSI for every bar in a single vectorized pass
+
+        Value i equals calculate_rsi(prices.iloc[:i + 1], period), so charts can
+        plot the RSI history without recomputing it bar by bar.
+
+        Args:
+            prices: Series of closing prices
+            period: RSI period (default 14 days)
+
+        Returns:
+            Series of RSI values (0-100), 50.0 where data is insufficient
+        """
+        delta = prices.diff()
+        gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
+        loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
+
+        rs = gain / loss
+        rsi = (100 - (100 / (1 + rs))).fillna(50.0)
+        rsi.iloc[:period] = 50.0  # Neutral value if insufficient data
+
+        return rsi
+
     def calculate_macd(self, prices: pd.Series) -> Tuple[float, float, float]:
         """
         Calculate MACD (Moving Average Convergence Divergence)
@@ -59,6 +137,10 @@ class StockScorer:
         if len(prices) < 26:
             return 0.0, 0.0, 0.0
         
+        arrays = _macd_arrays(prices)
+        if arrays is not None:
+            return tuple(a[-1] for a in arrays)  # np.float64, as from pandas
+        
         ema_12 = prices.ewm(span=12, adjust=False).mean()
         ema_26 = prices.ewm(span=26, adjust=False).mean()
         macd = ema_12 - ema_26
@@ -70,6 +152,35 @@ class StockScorer:
             signal.iloc[-1] if not pd.isna(signal.iloc[-1]) else 0.0,
             histogram.iloc[-1] if not pd.isna(histogram.iloc[-1]) else 0.0
         )
+
+    def calculate_macd_series(self, prices: pd.Series) -> Tuple[pd.Series, pd.Series, pd.Series]:
+        """
+        Calculate MACD, Signal and Histogram for every bar in a single EWM pass
+
+        EMAs are causal, so value i equals calculate_macd(prices.iloc[:i + 1]).
+        The first 26 bars (warm-up of the slow EMA) are reported as 0.
+
+        Args:
+            prices: Series of closing prices
+
+        Returns:
+            Tuple of (MACD, Signal, Histogram) Series
+        """
+        arrays = _macd_arrays(prices)
+        if arrays is not None:
+            macd, signal, histogram = (pd.Series(a, index=prices.index) for a in arrays)
+        else:
+            ema_12 = prices.ewm(span=12, adjust=False).mean()
+            ema_26 = prices.ewm(span=26, adjust=False).mean()
+            macd = ema_12 - ema_26
+            signal = macd.ewm(span=9, adjust=False).mean()
+            histogram = macd - signal
+
+        macd, signal, histogram = (s.fillna(0.0) for s in (macd, signal, histogram))
+        for series in (macd, signal, histogram):
+            series.iloc[:26] = 0.0  # Insufficient data for the 26-day EMA
+
+        return macd, signal, histogram
     
     def calculate_moving_averages(self, prices: pd.Series) -> Dict[str, float]:
         """
@@ -438,13 +549,16 @@ class StockScorer:
         # Use available data up to 'period' days
         # If less than requested period, use what's available (min 30 days)
         actual_period = min(period, len(hist_data))
-        recent_data = hist_data.tail(actual_period)
+        low_col = 'Low' if 'Low' in hist_data.columns else 'Close'
+        high_col = 'High' if 'High' in hist_data.columns else 'Close'
         
+        # Only the latest window is needed, so reduce the raw arrays directly
+        # (NaN-skipping like pandas min/max)
         # Support: minimum of low prices in period
-        support = recent_data['Low'].min() if 'Low' in recent_data.columns else recent_data['Close'].min()
+        support = np.nanmin(hist_data[low_col].to_numpy(dtype=np.float64)[-actual_period:])
         
         # Resistance: maximum of high prices in period
-        resistance = recent_data['High'].max() if 'High' in recent_data.columns else recent_data['Close'].max()
+        resistance = np.nanmax(hist_data[high_col].to_numpy(dtype=np.float64)[-actual_period:])
         
         return support, resistance, actual_period
     
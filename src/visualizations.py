@@ -4,39 +4,669 @@ Creates charts for price predictions and indicator analysis
 """
 import pandas as pd
 import numpy as np
-from typing import Dict, Optional
+from typing import Dict, List, Optional
+import functools
+import importlib.util
+import inspect
 import io
+import os
 import base64
+import threading
+from collections import OrderedDict
+import multiprocessing as mp
+from concurrent.futures import ProcessPoolExecutor
 
 
-try:
-    import matplotlib
-    matplotlib.use('Agg')  # Use non-interactive backend
-    import matplotlib.pyplot as plt
-    HAS_MATPLOTLIB = True
-except ImportError:
-    HAS_MATPLOTLIB = False
+# matplotlib itself is imported on first chart (see _load_renderer), so
+# importing this module stays cheap for callers that never plot. Cleared if
+# that import fails, e.g. on a broken install
+HAS_MATPLOTLIB = importlib.util.find_spec('matplotlib') is not None
+
+Figure = FigureCanvasAgg = FixedLocator = PolyCollection = LineCollection = Patch = Bbox = Image = None
+
+# Shared indicator calculator, built on first use (see _get_scorer)
+_scorer = None
+
+# Shared price predictors keyed by forecast_days (see _get_predictor)
+_predictors = {}
+
+# Fixed tick positions for the 0-100 indicator score axis
+_SCORE_TICKS = [0, 25, 50, 75, 100]
+
+# Score bar colours: red below 50, yellow 50-75, green 75 and above
+_SCORE_PALETTE = np.array(['#D62839', '#F5B700', '#06A77D'])
+_SCORE_BINS = [50, 75]
+
+
+def _hex_rgba(*colors: str) -> np.ndarray:
+    """Convert '#RRGGBB' strings to an (N, 4) RGBA palette, parsed once"""
+    return np.array([[int(c[i:i + 2], 16) / 255 for i in (1, 3, 5)] + [1.0]
+                     for c in colors])
+
+
+# Two-colour palettes for per-bar colouring, indexed by a boolean mask so
+# matplotlib gets ready RGBA rows instead of one hex string per bar
+_DOWN_UP_RGBA = _hex_rgba('#D62839', '#06A77D')  # red, green
+_VOLUME_RGBA = _hex_rgba('#2E86AB', '#D62839')   # normal, spike
+
+# Constrained-layout padding (inches); the figure edge is the image edge
+_LAYOUT_PADS = {'w_pad': 0.1, 'h_pad': 0.1}
+
+# Line simplification tolerance (pixels), set on each chart line's path
+# rather than through the process-wide rcParams. Coarser than matplotlib's
+# 1/9px default; long history lines need far fewer Agg segments
+_SIMPLIFY_THRESHOLD = 1.0
+
+# Default render resolution. Agg fill and PNG encode time scale with pixel
+# count, so the 12-16in wide charts use screen dpi (they are CSS-scaled to the
+# page width anyway); the small charts keep 100 so 8pt text stays legible.
+# A per-call dpi, then the visualizer's dpi / CHART_DPI, override these.
+_DEFAULT_DPI = 100
+_LARGE_CHART_DPI = 72
+
+# Shorter histories leave the MACD (26-day EMA) and RSI panels flat
+_MIN_TECHNICAL_BARS = 30
+
+
+def _load_renderer() -> bool:
+    """
+    Import the matplotlib figure/Agg/Pillow stack on first use
+
+    Figures get their own Agg canvas, so pyplot's backend is never touched.
+
+    Returns:
+        True if charts can be rendered
+    """
+    global Figure, FigureCanvasAgg, FixedLocator, PolyCollection, LineCollection, Patch, Bbox, Image
+    global HAS_MATPLOTLIB
+    if Figure is not None:
+        return True
+    if not HAS_MATPLOTLIB:
+        return False
+    try:
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.ticker import FixedLocator
+        from matplotlib.collections import PolyCollection, LineCollection
+        from matplotlib.patches import Patch
+        from matplotlib.transforms import Bbox
+        from PIL import Image  # Pillow is a hard dependency of matplotlib
+        from matplotlib.figure import Figure  # last: Figure doubles as the loaded flag
+    except ImportError:
+        HAS_MATPLOTLIB = False
+        return False
+    return True
+
+
+def _get_scorer():
+    """
+    Return the shared StockScorer used for chart indicator series
+
+    Imported lazily: scoring_system pulls in the data-source stack, and the
+    calculators are stateless so one instance serves every chart.
+
+    Returns:
+        StockScorer instance, or None if scoring_system is unavailable
+    """
+    global _scorer
+    if _scorer is None:
+        try:
+            from scoring_system import StockScorer
+        except ImportError:
+            return None
+        _scorer = StockScorer()
+    return _scorer
+
+
+def _get_predictor(forecast_days: int):
+    """
+    Return the shared PricePredictor for a forecast horizon
+
+    Args:
+        forecast_days: Number of days to forecast
 
+    Returns:
+        PricePredictor instance, imported and built on first use
+    """
+    predictor = _predictors.get(forecast_days)
+    if predictor is None:
+        from price_predictor import PricePredictor
+        predictor = _predictors[forecast_days] = PricePredictor(forecast_days=forecast_days)
+    return predictor
+
+
+# Per-thread pool of one figure per chart type, shared by all visualizers
+# (the app builds one per render); created on first use and redrawn
+# afterwards. Threads never share a figure, so no locking
+_figure_pool = threading.local()
+
+# Set once the first throwaway chart has been rendered in this process
+_renderer_warm = False
+
+
+def _warm_up_renderer():
+    """
+    Render and encode a tiny throwaway chart once per process
+
+    Moves the one-time cost of loading the renderer and resolving fonts onto
+    visualizer construction instead of the first user-facing chart.
+    """
+    global _renderer_warm
+    if _renderer_warm:
+        return
+    _renderer_warm = True
+    _load_renderer()
+    fig, ax = _new_figure((1, 1))
+    ax.plot([0, 1], [0, 1])
+    ax.set_title('warmup', fontweight='bold')
+    _encode_image(fig)
+
+
+# Rendered text-only placeholder charts keyed by (message, image format)
+_placeholders = {}
+
+
+def _placeholder_image(message: str, image_format: str = 'png') -> str:
+    """
+    Render a small text-only chart once per message and format
+
+    Args:
+        message: Text to show in place of the chart
+        image_format: 'png', 'webp' or 'jpeg'
+
+    Returns:
+        Base64-encoded image data URI
+    """
+    key = (message, image_format)
+    img_data = _placeholders.get(key)
+    if img_data is None:
+        _load_renderer()
+        fig, ax = _new_figure((6, 1.5))
+        fig.set_dpi(_DEFAULT_DPI)
+        ax.set_axis_off()
+        ax.text(0.5, 0.5, message, ha='center', va='center', fontsize=10,
+                transform=ax.transAxes)
+        img_data = _placeholders[key] = _encode_image(fig, image_format, palette=True)
+    return img_data
+
+
+def _new_figure(figsize, nrows: int = 1, ncols: int = 1):
+    """
+    Create a constrained-layout figure with an Agg canvas, outside pyplot
+
+    Figures are not registered with pyplot, so pooled ones are released
+    together with the thread that owns them.
+
+    Args:
+        figsize: Figure size in inches
+        nrows: Number of subplot rows
+        ncols: Number of subplot columns
+
+    Returns:
+        Tuple of (figure, axes)
+    """
+    fig = Figure(figsize=figsize, constrained_layout=_LAYOUT_PADS)
+    FigureCanvasAgg(fig)
+    return fig, fig.subplots(nrows, ncols)
+
+
+# Rendered-chart LRU shared by all visualizers (the app builds one per render).
+# Entries are whole data URIs (~170KB each at 72 dpi, several times that at
+# CHART_DPI=150), so the size is capped by CHART_CACHE_SIZE; 0 disables it
 try:
-    from scoring_system import StockScorer as _StockScorer
-    _HAS_SCORER = True
-except ImportError:
-    _HAS_SCORER = False
-    _StockScorer = None
+    _CHART_CACHE_SIZE = max(0, int(os.getenv('CHART_CACHE_SIZE', '64')))
+except ValueError:
+    _CHART_CACHE_SIZE = 64
+_chart_cache = OrderedDict()
+_chart_cache_lock = threading.Lock()
+# Rendered combined-chart halves (RGBA images), so a price-only refresh
+# reuses the unchanged scores panel; kept small as entries are raw pixels
+_PANEL_CACHE_SIZE = 32
+_panel_cache = OrderedDict()
+# Decimal places kept for scalar floats (prices, scores) in cache keys
+_KEY_DECIMALS = 4
+
+
+def _freeze(value):
+    """
+    Convert chart inputs into a hashable fingerprint
+
+    DataFrames and Series are reduced to a hash of their row hashes, so the
+    key stays small no matter how much history is passed in. Row hashes
+    ignore labels, so column names (Series name) and dtypes are keyed too.
+
+    Args:
+        value: Chart argument (scalars, dicts, lists, arrays, DataFrames)
+
+    Returns:
+        Hashable representation of the value
+    """
+    if isinstance(value, pd.DataFrame):
+        return ('DataFrame', value.shape, tuple(value.columns),
+                tuple(str(dtype) for dtype in value.dtypes),
+                hash(pd.util.hash_pandas_object(value).to_numpy().tobytes()))
+    if isinstance(value, pd.Series):
+        return ('Series', value.shape, value.name, str(value.dtype),
+                hash(pd.util.hash_pandas_object(value).to_numpy().tobytes()))
+    if isinstance(value, dict):
+        return tuple(sorted((str(k), _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, np.ndarray):
+        return (value.dtype.str, value.shape, hash(value.tobytes()))
+    if isinstance(value, (float, np.floating)):
+        # Labels show at most 2 decimals, so float noise should still hit
+        return round(float(value), _KEY_DECIMALS)
+    hash(value)  # raises TypeError for anything we cannot key on
+    return value
+
+
+def _cached_chart(method, cache: OrderedDict = _chart_cache, size: int = _CHART_CACHE_SIZE):
+    """
+    Memoize a create_* method's data URI on a fingerprint of its arguments
+
+    Inputs that cannot be fingerprinted are rendered without caching, and
+    None results (no matplotlib / no data) are never stored.
+
+    Args:
+        method: Visualizer method to wrap
+        cache: LRU the results are kept in
+        size: Maximum number of entries kept in the LRU
+    """
+    signature = inspect.signature(method)
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        bound = signature.bind(self, *args, **kwargs)
+        bound.apply_defaults()
+        try:
+            key = (method.__name__, self.image_format, self.dpi,
+                   _freeze(list(bound.arguments.values())[1:]))
+        except TypeError:
+            return method(self, *args, **kwargs)
+
+        with _chart_cache_lock:
+            cached = cache.get(key)
+            if cached is not None:
+                cache.move_to_end(key)
+                return cached
+
+        img_data = method(self, *args, **kwargs)
+        if img_data is not None:
+            with _chart_cache_lock:
+                cache[key] = img_data
+                if len(cache) > size:
+                    cache.popitem(last=False)
+        return img_data
+    return wrapper
+
+
+# Same memoization for the combined chart's panel images
+_cached_panel = functools.partial(_cached_chart, cache=_panel_cache, size=_PANEL_CACHE_SIZE)
+
+# RSI/MACD arrays per plotted Close window, shared by the technical and full
+# analysis charts (which plot the same 60-bar window)
+_INDICATOR_CACHE_SIZE = 64
+_indicator_cache = OrderedDict()
+
+
+def _indicator_series(closes: pd.Series):
+    """
+    Compute the RSI and MACD panel series for a Close window, memoized on its values
+
+    Args:
+        closes: Close prices of the plotted window
+
+    Returns:
+        Tuple of read-only (rsi, macd, signal, hist) float arrays
+    """
+    key = _freeze(closes)
+    with _chart_cache_lock:
+        cached = _indicator_cache.get(key)
+        if cached is not None:
+            _indicator_cache.move_to_end(key)
+            return cached
+
+    scorer = _get_scorer()
+    # First 14 RSI points are the neutral 50; MACD is 0 until the 26-day EMA fills
+    series = (scorer.calculate_rsi_series(closes, period=14),
+              *scorer.calculate_macd_series(closes))
+    arrays = tuple(s.to_numpy() for s in series)
+    for array in arrays:
+        array.setflags(write=False)  # shared between charts
+
+    with _chart_cache_lock:
+        _indicator_cache[key] = arrays
+        if len(_indicator_cache) > _INDICATOR_CACHE_SIZE:
+            _indicator_cache.popitem(last=False)
+    return arrays
+
+
+# Output encodings supported by _encode_image, keyed by CHART_FORMAT value
+_IMAGE_FORMATS = {'png': 'png', 'webp': 'webp', 'jpeg': 'jpeg', 'jpg': 'jpeg'}
+
+
+def _render_rgba(fig):
+    """
+    Render a figure once with Agg and wrap the canvas RGBA buffer for Pillow
+
+    The image shares the canvas buffer, so copy it before the figure is
+    redrawn if it must outlive this render.
+
+    Args:
+        fig: Matplotlib figure to render
+
+    Returns:
+        PIL RGBA image
+    """
+    for ax in fig.axes:
+        for line in ax.lines:
+            line.get_path().simplify_threshold = _SIMPLIFY_THRESHOLD
+    fig.canvas.draw()
+    width, height = fig.canvas.get_width_height(physical=True)
+    return Image.frombuffer('RGBA', (width, height), fig.canvas.buffer_rgba(),
+                            'raw', 'RGBA', 0, 1)
+
+
+def _encode_image(fig, image_format: str = 'png', palette: bool = False) -> str:
+    """
+    Render a figure once with Agg and encode it as a base64 image data URI
+
+    Bypasses savefig: the canvas RGBA buffer is handed straight to Pillow.
+
+    Args:
+        fig: Matplotlib figure to render
+        image_format: 'png', 'webp' or 'jpeg'
+        palette: Quantize to a 16-colour palette PNG (for flat bar charts only)
+
+    Returns:
+        Base64-encoded image data URI
+    """
+    return _encode_pil(_render_rgba(fig), image_format, palette)
+
+
+def _encode_pil(img, image_format: str = 'png', palette: bool = False) -> str:
+    """
+    Encode a PIL RGBA image as a base64 image data URI
+
+    PNG uses a fast zlib level since charts are mostly flat colour regions;
+    WebP is lossless at the fastest method, which on chart content is both
+    smaller and quicker to encode than PNG; JPEG is a lossy fallback.
+
+    Args:
+        img: PIL RGBA image
+        image_format: 'png', 'webp' or 'jpeg'
+        palette: Quantize to a 16-colour palette PNG (for flat bar charts only)
+
+    Returns:
+        Base64-encoded image data URI
+    """
+    buf = io.BytesIO()
+    if image_format == 'webp':
+        img.save(buf, format='WEBP', lossless=True, method=0)
+    elif image_format == 'jpeg':
+        img.convert('RGB').save(buf, format='JPEG', quality=85)
+    else:
+        image_format = 'png'
+        if palette:
+            img = img.convert('RGB').quantize(colors=16, method=Image.MEDIANCUT)
+        img.save(buf, format='PNG', compress_level=3, optimize=False)
+    img_base64 = base64.b64encode(buf.getbuffer()).decode('ascii')
+
+    return f"data:image/{image_format};base64,{img_base64}"
+
+
+def _clear_artists(ax):
+    """
+    Remove everything plotted on an axes while keeping its ticks and spines
+
+    Recreating the tick and spine machinery dominates ax.cla() on charts
+    that are redrawn with the same layout; this resets only the data side
+    (artists, legend, data limits, autoscaling and colour cycle).
+
+    Args:
+        ax: Axes to reset
+    """
+    for artist in (*ax.lines, *ax.collections, *ax.patches, *ax.texts, *ax.images):
+        artist.remove()
+    ax.containers.clear()
+    if ax.legend_ is not None:
+        ax.legend_.remove()
+    ax.dataLim.set_points(Bbox.null().get_points())
+    ax.ignore_existing_data_limits = True
+    ax.set_autoscale_on(True)
+    ax.set_prop_cycle(None)
+
+
+def _add_bars(ax, x: np.ndarray, heights: np.ndarray, colors, width: float = 0.8, **kwargs):
+    """
+    Draw a vertical bar series as one PolyCollection instead of a Rectangle per bar
+
+    Args:
+        ax: Axes to draw on
+        x: Bar centre positions
+        heights: Bar heights (may be negative)
+        colors: Face colour per bar
+        width: Bar width in data units
+        **kwargs: Extra PolyCollection properties (alpha, label, ...)
+
+    Returns:
+        The added PolyCollection
+    """
+    left = x - width / 2
+    right = x + width / 2
+    zeros = np.zeros_like(heights, dtype=np.float64)
+    verts = np.stack([np.column_stack([left, zeros]), np.column_stack([left, heights]),
+                      np.column_stack([right, heights]), np.column_stack([right, zeros])],
+                     axis=1)
+    bars = PolyCollection(verts, facecolors=colors, edgecolors='none', linewidths=0, **kwargs)
+    bars.sticky_edges.y.append(0)  # like ax.bar: no autoscale margin below the baseline
+    ax.add_collection(bars)
+    ax.autoscale_view()
+    return bars
+
+
+def _close_volume(hist_data: pd.DataFrame):
+    """
+    Extract Close and Volume in one block-manager pass
+
+    Args:
+        hist_data: OHLCV DataFrame (already trimmed to the plotted window)
+
+    Returns:
+        Tuple of contiguous float64 (closes, volumes) arrays
+    """
+    block = np.ascontiguousarray(hist_data[['Close', 'Volume']].to_numpy(dtype=np.float64).T)
+    return block[0], block[1]
+
+
+def _pack_hist(hist_data: Optional[pd.DataFrame]) -> Optional[Dict]:
+    """Flatten OHLCV history to numpy arrays, which pickle much faster than a DataFrame"""
+    if hist_data is None:
+        return None
+    return {
+        'index': hist_data.index.to_numpy(),
+        'columns': list(hist_data.columns),
+        'values': hist_data.to_numpy(),
+    }
+
+
+def _unpack_hist(packed: Optional[Dict]) -> Optional[pd.DataFrame]:
+    """Rebuild the OHLCV DataFrame produced by _pack_hist"""
+    if packed is None:
+        return None
+    return pd.DataFrame(packed['values'], index=packed['index'],
+                        columns=packed['columns'])
+
+
+# Per-process visualizers (one per image format and dpi) used by batch
+# workers, so figures are reused across jobs
+_worker_visualizers = {}
+
 
-# Default fallback confidence band half-width (±3% around current price)
-_DEFAULT_CONF_BAND = 0.03
+def _render_one(job: Dict) -> Optional[str]:
+    """
+    Render a single chart job inside a worker process
+
+    Args:
+        job: Dict with 'chart' (e.g. 'full_analysis' for create_full_analysis_chart),
+             'image_format', 'dpi', 'symbol', optional packed 'hist_data' and any
+             other chart keyword arguments
+
+    Returns:
+        Base64-encoded image or None
+    """
+    kwargs = dict(job)
+    settings = (kwargs.pop('image_format', None), kwargs.pop('dpi', None))
+    visualizer = _worker_visualizers.get(settings)
+    if visualizer is None:
+        visualizer = _worker_visualizers[settings] = StockVisualizer(*settings)
+
+    method = getattr(visualizer, f"create_{kwargs.pop('chart')}_chart")
+    if 'hist_data' in kwargs:
+        kwargs['hist_data'] = _unpack_hist(kwargs['hist_data'])
+    return method(**kwargs)
 
 
 class StockVisualizer:
     """Create visualizations for stock analysis"""
     
-    def __init__(self):
-        """Initialize visualizer"""
-        self.has_matplotlib = HAS_MATPLOTLIB
+    def __init__(self, image_format: Optional[str] = None, dpi: Optional[int] = None):
+        """
+        Initialize visualizer
+        
+        Args:
+            image_format: Chart encoding ('png', 'webp' or 'jpeg'); defaults to
+                          the CHART_FORMAT environment variable, then PNG
+            dpi: Render resolution for every chart (e.g. 150 for report export);
+                 defaults to CHART_DPI, then 100 for small charts and 72 for the
+                 wide technical, backtested and full analysis charts
+        """
+        image_format = (image_format or os.getenv('CHART_FORMAT', 'png')).lower()
+        self.image_format = _IMAGE_FORMATS.get(image_format, 'png')
+        if dpi is None:
+            try:
+                dpi = int(os.getenv('CHART_DPI', '')) or None
+            except ValueError:
+                dpi = None
+        self.dpi = dpi
+        if os.getenv('CHART_WARMUP', '1') == '1' and self.has_matplotlib:
+            _warm_up_renderer()
+    
+    @property
+    def has_matplotlib(self) -> bool:
+        """Whether charts can be rendered; imports matplotlib on first check"""
+        return _load_renderer()
+    
+    def _get_figure(self, name: str, factory, dpi: Optional[int] = None,
+                    default_dpi: int = _DEFAULT_DPI, keep_axes: bool = False):
+        """
+        Return this thread's cached figure and axes for a chart type
+        
+        Args:
+            name: Chart type key
+            factory: Callable building (figure, axes) on first use
+            dpi: Resolution requested for this call, if any
+            default_dpi: Chart's resolution when neither the call nor the
+                         visualizer sets one
+            keep_axes: Only remove the plotted artists and keep the axes
+                       skeleton (ticks, spines, labels); for charts that set
+                       the same axes properties on every render
+            
+        Returns:
+            Tuple of (figure, axes) with all axes cleared for redrawing
+        """
+        figures = _figure_pool.__dict__.setdefault('figures', {})
+        cached = figures.get(name)
+        dpi = dpi or self.dpi or default_dpi
+        if cached is None:
+            _load_renderer()
+            cached = figures[name] = factory()
+            cached[0].set_dpi(dpi)
+        else:
+            if cached[0].dpi != dpi:
+                cached[0].set_dpi(dpi)
+            fig = cached[0]
+            for ax in fig.axes:
+                if keep_axes:
+                    _clear_artists(ax)
+                else:
+                    ax.cla()
+                # Constrained layout starts from the current positions, so
+                # rewind them to the gridspec slots to keep output stable
+                # (set_position opts the axes out of the layout; opt back in)
+                ax.set_position(ax.get_subplotspec().get_position(fig))
+                ax.set_in_layout(True)
+        return cached
+    
+    def _new_technical_figure(self):
+        """Build the 4-panel (price, volume, RSI, MACD) technical analysis figure"""
+        fig = Figure(figsize=(12, 10), constrained_layout=_LAYOUT_PADS)
+        FigureCanvasAgg(fig)
+        gs = fig.add_gridspec(4, 1, height_ratios=[3, 1, 1, 1])
+        
+        ax_price = fig.add_subplot(gs[0])
+        ax_volume = fig.add_subplot(gs[1], sharex=ax_price)
+        ax_rsi = fig.add_subplot(gs[2], sharex=ax_price)
+        ax_macd = fig.add_subplot(gs[3], sharex=ax_price)
+        return fig, (ax_price, ax_volume, ax_rsi, ax_macd)
+    
+    def _new_full_analysis_figure(self):
+        """Build the full analysis figure: 4 technical rows + score column"""
+        fig = Figure(figsize=(16, 12))
+        FigureCanvasAgg(fig)
+        gs = fig.add_gridspec(4, 2, width_ratios=[3, 1],
+                              height_ratios=[3, 1, 1, 1], hspace=0.35, wspace=0.3)
+
+        ax_price = fig.add_subplot(gs[0, 0])
+        ax_volume = fig.add_subplot(gs[1, 0], sharex=ax_price)
+        ax_rsi = fig.add_subplot(gs[2, 0], sharex=ax_price)
+        ax_macd = fig.add_subplot(gs[3, 0], sharex=ax_price)
+        ax_scores = fig.add_subplot(gs[:, 1])  # spans all 4 rows
+
+        fig.subplots_adjust(left=0.07, right=0.95, top=0.95, bottom=0.08,
+                            hspace=0.35, wspace=0.3)
+        return fig, (ax_price, ax_volume, ax_rsi, ax_macd, ax_scores)
+    
+    def create_charts_batch(self, jobs: List[Dict]) -> List[Optional[str]]:
+        """
+        Render many independent charts (e.g. one per screened ticker) in parallel
+        
+        Each job is one create_* call: 'chart' names the chart type (e.g.
+        'full_analysis' for create_full_analysis_chart) and the remaining keys
+        are its keyword arguments. Rendering is CPU-bound in Agg and PNG
+        encoding, so jobs are spread over a process pool.
+        
+        Args:
+            jobs: List of chart job dicts
+            
+        Returns:
+            List of base64-encoded images (or None) in job order
+        """
+        if not self.has_matplotlib or not jobs:
+            return [None] * len(jobs)
+        
+        packed = []
+        for job in jobs:
+            job = dict(job, image_format=self.image_format, dpi=self.dpi)
+            if isinstance(job.get('hist_data'), pd.DataFrame):
+                job['hist_data'] = _pack_hist(job['hist_data'])
+            packed.append(job)
+        
+        workers = min(len(packed), os.cpu_count() or 1)
+        if workers == 1:
+            return [_render_one(job) for job in packed]
+        
+        # spawn: matplotlib is not fork-safe on macOS
+        with ProcessPoolExecutor(max_workers=workers,
+                                 mp_context=mp.get_context('spawn')) as ex:
+            # A few jobs per round trip; small enough to keep workers balanced
+            chunksize = max(1, len(packed) // (workers * 4))
+            return list(ex.map(_render_one, packed, chunksize=chunksize))
     
+    @_cached_chart
     def create_price_range_chart(self, symbol: str, prediction: Dict, 
-                                 hist_data: Optional[pd.DataFrame] = None) -> Optional[str]:
+                                 hist_data: Optional[pd.DataFrame] = None,
+                                 dpi: Optional[int] = None) -> Optional[str]:
         """
         Create a chart showing predicted price range
         
@@ -44,26 +674,30 @@ class StockVisualizer:
             symbol: Stock ticker symbol
             prediction: Price prediction dictionary
             hist_data: Optional historical data to show recent price history
+            dpi: Render resolution override (e.g. 150 for report export)
             
         Returns:
-            Base64-encoded PNG image or None if matplotlib not available
+            Base64-encoded image or None if matplotlib not available
         """
         if not self.has_matplotlib:
             return None
         
-        fig, ax = plt.subplots(figsize=(6, 3))
+        fig, ax = self._get_figure('price_range', lambda: _new_figure((6, 3)), dpi)
         
         current_price = prediction.get('current_price', 0)
         predicted_price = prediction.get('predicted_price', current_price)
         forecast_days = prediction.get('forecast_days', 14)
         
+        x_ticks = [0, forecast_days]
+        
         # If we have historical data, plot it
         if hist_data is not None and not hist_data.empty and len(hist_data) > 5:
             # Show last 30 days of history
-            recent_hist = hist_data.tail(30).copy()
-            recent_hist['day'] = list(range(-len(recent_hist), 0))
-            ax.plot(recent_hist['day'], recent_hist['Close'], 
+            close_arr = hist_data['Close'].to_numpy()[-30:]
+            day_arr = np.arange(-close_arr.size, 0)
+            ax.plot(day_arr, close_arr, 
                    color='#2E86AB', linewidth=1.5, label='Historical Price')
+            x_ticks.insert(0, int(day_arr[0]))
             
             # Mark current price
             ax.scatter([0], [current_price], color='#2E86AB', s=50, zorder=5)
@@ -72,7 +706,7 @@ class StockVisualizer:
             ax.scatter([0], [current_price], color='#2E86AB', s=50, zorder=5, label='Current Price')
         
         # Forecast visualization
-        forecast_x = [0, forecast_days]
+        forecast_x = (0, forecast_days)
         
         # Predicted price line
         ax.plot(forecast_x, [current_price, predicted_price], 
@@ -98,39 +732,37 @@ class StockVisualizer:
         
         # Formatting
         ax.set_xlabel('Days', fontsize=9)
-        ax.set_ylabel('Price ($)', fontsize=9)
+        ax.set_ylabel('Price ($)', fontsize=9, parse_math=False)
         ax.set_title(f'{symbol} - {forecast_days} Day Price Forecast', fontsize=10, fontweight='bold')
         ax.legend(loc='best', fontsize=7)
         ax.grid(True, alpha=0.3, linestyle='--')
         ax.tick_params(labelsize=8)
+        ax.xaxis.set_major_locator(FixedLocator(x_ticks))
         
         # Add price annotations
         ax.annotate(f'${predicted_price:.2f}', 
                    xy=(forecast_days, predicted_price), 
                    xytext=(5, 5), textcoords='offset points',
-                   fontsize=8, color='#A23B72', fontweight='bold')
-        
-        plt.tight_layout()
+                   fontsize=8, color='#A23B72', fontweight='bold', parse_math=False)
         
         # Convert to base64
-        buf = io.BytesIO()
-        plt.savefig(buf, format='png', dpi=100, bbox_inches='tight')
-        plt.close(fig)
-        buf.seek(0)
-        img_base64 = base64.b64encode(buf.read()).decode('utf-8')
+        img_data = _encode_image(fig, self.image_format)
         
-        return f"data:image/png;base64,{img_base64}"
+        return img_data
     
-    def create_indicator_breakdown_chart(self, symbol: str, score_data: Dict) -> Optional[str]:
+    @_cached_chart
+    def create_indicator_breakdown_chart(self, symbol: str, score_data: Dict,
+                                         dpi: Optional[int] = None) -> Optional[str]:
         """
         Create a horizontal bar chart showing indicator contributions to score
         
         Args:
             symbol: Stock ticker symbol
             score_data: Score data dictionary with score_contributions
+            dpi: Render resolution override (e.g. 150 for report export)
             
         Returns:
-            Base64-encoded PNG image or None if matplotlib not available
+            Base64-encoded image or None if matplotlib not available
         """
         if not self.has_matplotlib:
             return None
@@ -140,57 +772,44 @@ class StockVisualizer:
         if not score_contributions:
             return None
         
-        # Prepare data for plotting
-        labels = []
-        values = []
-        for key, value in score_contributions.items():
-            # Clean up label names
-            label = key.replace('_score', '').replace('_', ' ').title()
-            labels.append(label)
-            values.append(value)
+        # Prepare data for plotting (clean up label names)
+        labels = [key.replace('_score', '').replace('_', ' ').title()
+                  for key in score_contributions]
+        values = np.fromiter(score_contributions.values(), dtype=np.float64,
+                             count=len(score_contributions))
         
         # Create horizontal bar chart
-        fig, ax = plt.subplots(figsize=(5, 3))
+        fig, ax = self._get_figure('indicator_breakdown', lambda: _new_figure((5, 3)), dpi)
         
         # Color bars based on value (green for high, red for low)
-        colors = []
-        for v in values:
-            if v >= 75:
-                colors.append('#06A77D')  # Green
-            elif v >= 50:
-                colors.append('#F5B700')  # Yellow
-            else:
-                colors.append('#D62839')  # Red
+        colors = _SCORE_PALETTE[np.digitize(values, _SCORE_BINS)].tolist()
         
         y_pos = np.arange(len(labels))
-        ax.barh(y_pos, values, color=colors, alpha=0.8)
+        bars = ax.barh(y_pos, values, color=colors, alpha=0.8)
         
         # Formatting
         ax.set_yticks(y_pos)
         ax.set_yticklabels(labels, fontsize=8)
         ax.set_xlabel('Score (0-100)', fontsize=9)
         ax.set_xlim(0, 100)
+        ax.xaxis.set_major_locator(FixedLocator(_SCORE_TICKS))
         ax.set_title(f'{symbol} - Indicator Scores', fontsize=10, fontweight='bold')
         ax.grid(True, axis='x', alpha=0.3, linestyle='--')
+        ax.grid(False, axis='y')
         ax.tick_params(labelsize=8)
         
         # Add value labels on bars
-        for i, v in enumerate(values):
-            ax.text(v + 2, i, f'{v:.1f}', va='center', fontsize=8, fontweight='bold')
-        
-        plt.tight_layout()
+        ax.bar_label(bars, fmt='%.1f', padding=5, fontsize=8, fontweight='bold')
         
         # Convert to base64
-        buf = io.BytesIO()
-        plt.savefig(buf, format='png', dpi=100, bbox_inches='tight')
-        plt.close(fig)
-        buf.seek(0)
-        img_base64 = base64.b64encode(buf.read()).decode('utf-8')
+        img_data = _encode_image(fig, self.image_format, palette=True)
         
-        return f"data:image/png;base64,{img_base64}"
+        return img_data
     
+    @_cached_chart
     def create_combined_chart(self, symbol: str, score_data: Dict, 
-                             prediction: Dict, hist_data: Optional[pd.DataFrame] = None) -> Optional[str]:
+                             prediction: Dict, hist_data: Optional[pd.DataFrame] = None,
+                             dpi: Optional[int] = None) -> Optional[str]:
         """
         Create a combined chart with price forecast and indicator breakdown
         
@@ -199,108 +818,138 @@ class StockVisualizer:
             score_data: Score data dictionary
             prediction: Price prediction dictionary
             hist_data: Optional historical data
+            dpi: Render resolution override (e.g. 150 for report export)
             
         Returns:
-            Base64-encoded PNG image or None if matplotlib not available
+            Base64-encoded image or None if matplotlib not available
         """
         if not self.has_matplotlib:
             return None
         
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(10, 3.5))
+        # Score panels depend only on the scores, so a price-only refresh
+        # pastes the cached right half next to a freshly drawn left half
+        left = self._render_combined_forecast_panel(prediction, hist_data, dpi)
+        right = self._render_combined_scores_panel(
+            score_data.get('score_contributions', {}), dpi)
+        
+        combined = Image.new('RGBA', (left.width + right.width, max(left.height, right.height)))
+        combined.paste(left, (0, 0))
+        combined.paste(right, (left.width, 0))
+        
+        # Convert to base64
+        img_data = _encode_pil(combined, self.image_format)
+        
+        return img_data
+    
+    @_cached_panel
+    def _render_combined_forecast_panel(self, prediction: Dict,
+                                        hist_data: Optional[pd.DataFrame],
+                                        dpi: Optional[int]):
+        """
+        Draw the price forecast half of the combined chart
+        
+        Args:
+            prediction: Price prediction dictionary
+            hist_data: Optional historical data
+            dpi: Render resolution override
+            
+        Returns:
+            PIL RGBA image of the panel
+        """
+        fig, ax = self._get_figure('combined_forecast', lambda: _new_figure((5, 3.5)), dpi)
         
-        # Left plot: Price forecast
         current_price = prediction.get('current_price', 0)
         predicted_price = prediction.get('predicted_price', current_price)
         forecast_days = prediction.get('forecast_days', 14)
+        x_ticks = [0, forecast_days]
         
         # If we have historical data, plot it
         if hist_data is not None and not hist_data.empty and len(hist_data) > 5:
-            recent_hist = hist_data.tail(90).copy()  # Use 90 days for resistance and support bands
-            recent_hist['day'] = list(range(-len(recent_hist), 0))
-            
             # Calculate 90-day resistance and support levels
-            resistance_90d = recent_hist['High'].max()
-            support_90d = recent_hist['Low'].min()
+            resistance_90d = np.nanmax(hist_data['High'].to_numpy()[-90:])
+            support_90d = np.nanmin(hist_data['Low'].to_numpy()[-90:])
             
             # Plot historical price with last 30 days visible
-            display_hist = recent_hist.tail(30).copy()
-            display_hist['day'] = list(range(-len(display_hist), 0))
-            ax1.plot(display_hist['day'], display_hist['Close'], 
+            close_arr = hist_data['Close'].to_numpy()[-30:]
+            day_arr = np.arange(-close_arr.size, 0)
+            ax.plot(day_arr, close_arr, 
                     color='#2E86AB', linewidth=1.5, label='Historical')
-            ax1.scatter([0], [current_price], color='#2E86AB', s=50, zorder=5)
+            x_ticks.insert(0, int(day_arr[0]))
+            ax.scatter([0], [current_price], color='#2E86AB', s=50, zorder=5)
             
             # Plot 90-day resistance and support bands
-            ax1.axhline(y=resistance_90d, color='#D62839', linestyle='--', 
-                       linewidth=1.5, alpha=0.7, label=f'90d Resistance (${resistance_90d:.2f})')
-            ax1.axhline(y=support_90d, color='#06A77D', linestyle='--', 
-                       linewidth=1.5, alpha=0.7, label=f'90d Support (${support_90d:.2f})')
+            ax.axhline(y=resistance_90d, color='#D62839', linestyle='--', 
+                       linewidth=1.5, alpha=0.7, label=rf'90d Resistance (\${resistance_90d:.2f})')
+            ax.axhline(y=support_90d, color='#06A77D', linestyle='--', 
+                       linewidth=1.5, alpha=0.7, label=rf'90d Support (\${support_90d:.2f})')
         else:
-            ax1.scatter([0], [current_price], color='#2E86AB', s=50, zorder=5, label='Current')
+            ax.scatter([0], [current_price], color='#2E86AB', s=50, zorder=5, label='Current')
         
         # Forecast
-        forecast_x = [0, forecast_days]
-        ax1.plot(forecast_x, [current_price, predicted_price], 
+        forecast_x = (0, forecast_days)
+        ax.plot(forecast_x, [current_price, predicted_price], 
                 color='#A23B72', linewidth=2, linestyle='--', label='Forecast')
         
         # Confidence bands
         conf_low = prediction.get('confidence_80_low', current_price * 0.97)
         conf_high = prediction.get('confidence_80_high', current_price * 1.03)
-        ax1.fill_between(forecast_x, [current_price, conf_low], [current_price, conf_high],
+        ax.fill_between(forecast_x, [current_price, conf_low], [current_price, conf_high],
                         alpha=0.3, color='#A23B72', label='80% Conf.')
         
-        ax1.set_xlabel('Days', fontsize=9)
-        ax1.set_ylabel('Price ($)', fontsize=9)
-        ax1.set_title(f'Price Forecast ({forecast_days} Days)', fontsize=10, fontweight='bold')
-        ax1.legend(loc='best', fontsize=6)  # Reduced font size to fit more items
-        ax1.grid(True, alpha=0.3, linestyle='--')
-        ax1.tick_params(labelsize=8)
+        ax.set_xlabel('Days', fontsize=9)
+        ax.set_ylabel('Price ($)', fontsize=9, parse_math=False)
+        ax.set_title(f'Price Forecast ({forecast_days} Days)', fontsize=10, fontweight='bold')
+        ax.legend(loc='best', fontsize=6)  # Reduced font size to fit more items
+        ax.grid(True, alpha=0.3, linestyle='--')
+        ax.tick_params(labelsize=8)
+        ax.xaxis.set_major_locator(FixedLocator(x_ticks))
         
-        # Right plot: Indicator breakdown
-        score_contributions = score_data.get('score_contributions', {})
+        return _render_rgba(fig).copy()
+    
+    @_cached_panel
+    def _render_combined_scores_panel(self, score_contributions: Dict, dpi: Optional[int]):
+        """
+        Draw the indicator score half of the combined chart
+        
+        Args:
+            score_contributions: Indicator name to score mapping (may be empty)
+            dpi: Render resolution override
+            
+        Returns:
+            PIL RGBA image of the panel
+        """
+        fig, ax = self._get_figure('combined_scores', lambda: _new_figure((5, 3.5)), dpi)
         
         if score_contributions:
-            labels = []
-            values = []
-            for key, value in score_contributions.items():
-                label = key.replace('_score', '').replace('_', ' ').title()
-                labels.append(label)
-                values.append(value)
+            labels = [key.replace('_score', '').replace('_', ' ').title()
+                      for key in score_contributions]
+            values = np.fromiter(score_contributions.values(), dtype=np.float64,
+                                 count=len(score_contributions))
             
-            colors = []
-            for v in values:
-                if v >= 75:
-                    colors.append('#06A77D')
-                elif v >= 50:
-                    colors.append('#F5B700')
-                else:
-                    colors.append('#D62839')
+            colors = _SCORE_PALETTE[np.digitize(values, _SCORE_BINS)].tolist()
             
             y_pos = np.arange(len(labels))
-            ax2.barh(y_pos, values, color=colors, alpha=0.8)
-            ax2.set_yticks(y_pos)
-            ax2.set_yticklabels(labels, fontsize=8)
-            ax2.set_xlabel('Score (0-100)', fontsize=9)
-            ax2.set_xlim(0, 100)
-            ax2.set_title('Indicator Scores', fontsize=10, fontweight='bold')
-            ax2.grid(True, axis='x', alpha=0.3, linestyle='--')
-            ax2.tick_params(labelsize=8)
+            bars = ax.barh(y_pos, values, color=colors, alpha=0.8)
+            ax.set_yticks(y_pos)
+            ax.set_yticklabels(labels, fontsize=8)
+            ax.set_xlabel('Score (0-100)', fontsize=9)
+            ax.set_xlim(0, 100)
+            ax.xaxis.set_major_locator(FixedLocator(_SCORE_TICKS))
+            ax.set_title('Indicator Scores', fontsize=10, fontweight='bold')
+            ax.grid(True, axis='x', alpha=0.3, linestyle='--')
+            ax.grid(False, axis='y')
+            ax.tick_params(labelsize=8)
             
-            for i, v in enumerate(values):
-                ax2.text(v + 2, i, f'{v:.1f}', va='center', fontsize=7, fontweight='bold')
-        
-        plt.tight_layout()
-        
-        # Convert to base64
-        buf = io.BytesIO()
-        plt.savefig(buf, format='png', dpi=100, bbox_inches='tight')
-        plt.close(fig)
-        buf.seek(0)
-        img_base64 = base64.b64encode(buf.read()).decode('utf-8')
+            ax.bar_label(bars, fmt='%.1f', padding=5, fontsize=7, fontweight='bold')
+        else:
+            ax.grid(False)
         
-        return f"data:image/png;base64,{img_base64}"
+        return _render_rgba(fig).copy()
     
+    @_cached_chart
     def create_technical_analysis_chart(self, symbol: str, score_data: Dict, 
-                                       hist_data: Optional[pd.DataFrame] = None) -> Optional[str]:
+                                       hist_data: Optional[pd.DataFrame] = None,
+                                       dpi: Optional[int] = None) -> Optional[str]:
         """
         Create a comprehensive technical analysis chart with price, volume, RSI, and MACD
         
@@ -308,98 +957,92 @@ class StockVisualizer:
             symbol: Stock ticker symbol
             score_data: Score data dictionary with indicators
             hist_data: Historical OHLCV data
+            dpi: Render resolution override (e.g. 150 for report export)
             
         Returns:
-            Base64-encoded PNG image or None if matplotlib not available
+            Base64-encoded image or None if matplotlib not available
         """
         if not self.has_matplotlib or hist_data is None or hist_data.empty:
             return None
         
-        # Create figure with 4 subplots (price, volume, RSI, MACD)
-        fig = plt.figure(figsize=(12, 10))
-        gs = fig.add_gridspec(4, 1, height_ratios=[3, 1, 1, 1], hspace=0.3)
+        # Indicator panels would be meaningless; skip the full render
+        if len(hist_data) < _MIN_TECHNICAL_BARS:
+            return _placeholder_image('Not enough price history for technical analysis',
+                                      self.image_format)
         
-        ax_price = fig.add_subplot(gs[0])
-        ax_volume = fig.add_subplot(gs[1], sharex=ax_price)
-        ax_rsi = fig.add_subplot(gs[2], sharex=ax_price)
-        ax_macd = fig.add_subplot(gs[3], sharex=ax_price)
+        # Reuse the figure with 4 subplots (price, volume, RSI, MACD)
+        fig, (ax_price, ax_volume, ax_rsi, ax_macd) = self._get_figure(
+            'technical_analysis', self._new_technical_figure, dpi, _LARGE_CHART_DPI,
+            keep_axes=True)
         
         # Prepare data (use last 60 days for visibility)
-        plot_data = hist_data.tail(60).copy()
-        plot_data['day'] = range(len(plot_data))
+        # Work on raw arrays: pandas per-call overhead dominates on 60 rows
+        tail = hist_data.iloc[-60:]
+        closes, vols = _close_volume(tail)
+        days = np.arange(len(closes))
         
         # Get support/resistance from score_data
         support_resistance = score_data.get('support_resistance', {})
         support = support_resistance.get('support', 0)
         resistance = support_resistance.get('resistance', 0)
-        current_price = plot_data['Close'].iloc[-1] if not plot_data.empty else 0
+        current_price = closes[-1] if len(closes) else 0
         
         # --- Price Chart with Support/Resistance ---
-        ax_price.plot(plot_data['day'], plot_data['Close'], 
+        ax_price.plot(days, closes, 
                      color='#2E86AB', linewidth=2, label='Price')
         
         # Add support and resistance lines
         if support > 0:
             ax_price.axhline(y=support, color='#06A77D', linestyle='--', 
-                           linewidth=2, alpha=0.7, label=f'Support: ${support:.2f}')
+                           linewidth=2, alpha=0.7, label=rf'Support: \${support:.2f}')
         if resistance > 0:
             ax_price.axhline(y=resistance, color='#D62839', linestyle='--', 
-                           linewidth=2, alpha=0.7, label=f'Resistance: ${resistance:.2f}')
+                           linewidth=2, alpha=0.7, label=rf'Resistance: \${resistance:.2f}')
         
         # Highlight current price
-        ax_price.scatter([plot_data['day'].iloc[-1]], [current_price], 
-                        color='#A23B72', s=100, zorder=5, label=f'Current: ${current_price:.2f}')
+        ax_price.scatter([days[-1]], [current_price], 
+                        color='#A23B72', s=100, zorder=5, label=rf'Current: \${current_price:.2f}')
         
-        ax_price.set_ylabel('Price ($)', fontsize=10, fontweight='bold')
+        ax_price.set_ylabel('Price ($)', fontsize=10, fontweight='bold', parse_math=False)
         ax_price.set_title(f'{symbol} - Technical Analysis', fontsize=12, fontweight='bold')
         ax_price.legend(loc='upper left', fontsize=9)
         ax_price.grid(True, alpha=0.3, linestyle='--')
         ax_price.tick_params(labelsize=9)
         
         # --- Volume Chart with Spike Highlighting ---
-        # Calculate average volume
-        avg_volume = plot_data['Volume'].mean()
-        volume_colors = ['#D62839' if v >= avg_volume * 1.5 else '#2E86AB' 
-                        for v in plot_data['Volume']]
-        
-        ax_volume.bar(plot_data['day'], plot_data['Volume'], 
-                     color=volume_colors, alpha=0.7, width=0.8)
-        ax_volume.axhline(y=avg_volume * 1.5, color='#D62839', linestyle='--', 
+        # Spike threshold: 1.5x the average volume
+        spike_volume = vols.mean() * 1.5
+        volume_colors = _VOLUME_RGBA[(vols >= spike_volume).astype(np.intp)]
+        
+        _add_bars(ax_volume, days, vols, volume_colors, alpha=0.7,
+                  antialiased=False)
+        ax_volume.axhline(y=spike_volume, color='#D62839', linestyle='--', 
                          linewidth=1.5, alpha=0.5, label='1.5x Avg Volume')
         
         ax_volume.set_ylabel('Volume', fontsize=10, fontweight='bold')
         ax_volume.legend(loc='upper left', fontsize=8)
         ax_volume.grid(True, alpha=0.3, linestyle='--', axis='y')
+        ax_volume.grid(False, axis='x')
         ax_volume.tick_params(labelsize=9)
         ax_volume.ticklabel_format(style='plain', axis='y')
         
         # --- RSI Chart ---
-        # Calculate RSI for the plot data
-        scorer = _StockScorer() if _HAS_SCORER else None
-        
-        # Calculate RSI for each point
-        rsi_values = []
-        for i in range(len(plot_data)):
-            if i < 14:
-                # Insufficient data for 14-period RSI calculation
-                # Use 50 as neutral midpoint (RSI scale is 0-100, 50 represents neutral momentum)
-                rsi_values.append(50)
-            else:
-                prices_slice = plot_data['Close'].iloc[:i+1]
-                rsi_val = scorer.calculate_rsi(prices_slice, period=14)
-                rsi_values.append(rsi_val)
-        
-        plot_data['RSI'] = rsi_values
-        
-        ax_rsi.plot(plot_data['day'], plot_data['RSI'], 
+        # RSI and MACD for every point in one pass
+        # (first 14 RSI points use 50 as neutral midpoint, RSI scale is 0-100)
+        rsi, macd, signal, hist = _indicator_series(tail['Close'])
+        
+        ax_rsi.plot(days, rsi, 
                    color='#A23B72', linewidth=2, label='RSI')
         
         # Add overbought/oversold zones
         ax_rsi.axhline(y=70, color='#D62839', linestyle='--', linewidth=1, alpha=0.5)
         ax_rsi.axhline(y=30, color='#06A77D', linestyle='--', linewidth=1, alpha=0.5)
-        ax_rsi.fill_between(plot_data['day'], 70, 100, alpha=0.1, color='#D62839', label='Overbought')
-        ax_rsi.fill_between(plot_data['day'], 0, 30, alpha=0.1, color='#06A77D', label='Oversold')
-        ax_rsi.fill_between(plot_data['day'], 50, 70, alpha=0.05, color='#F5B700', label='Momentum Zone')
+        ax_rsi.fill_between(days, 70, 100, alpha=0.1, color='#D62839', label='Overbought',
+                            antialiased=False)
+        ax_rsi.fill_between(days, 0, 30, alpha=0.1, color='#06A77D', label='Oversold',
+                            antialiased=False)
+        ax_rsi.fill_between(days, 50, 70, alpha=0.05, color='#F5B700', label='Momentum Zone',
+                            antialiased=False)
         
         ax_rsi.set_ylabel('RSI', fontsize=10, fontweight='bold')
         ax_rsi.set_ylim(0, 100)
@@ -408,39 +1051,19 @@ class StockVisualizer:
         ax_rsi.tick_params(labelsize=9)
         
         # --- MACD Chart ---
-        # Calculate MACD for each point
-        macd_values = []
-        signal_values = []
-        histogram_values = []
-        
-        for i in range(len(plot_data)):
-            if i < 26:
-                # Insufficient data for MACD calculation
-                # MACD uses 12-day and 26-day EMAs, so requires minimum 26 data points
-                macd_values.append(0)
-                signal_values.append(0)
-                histogram_values.append(0)
-            else:
-                prices_slice = plot_data['Close'].iloc[:i+1]
-                macd, signal, hist = scorer.calculate_macd(prices_slice)
-                macd_values.append(macd)
-                signal_values.append(signal)
-                histogram_values.append(hist)
-        
-        plot_data['MACD'] = macd_values
-        plot_data['MACD_Signal'] = signal_values
-        plot_data['MACD_Hist'] = histogram_values
-        
-        # Plot MACD histogram
-        hist_colors = ['#06A77D' if h > 0 else '#D62839' for h in plot_data['MACD_Hist']]
-        ax_macd.bar(plot_data['day'], plot_data['MACD_Hist'], 
-                   color=hist_colors, alpha=0.5, width=0.8, label='MACD Histogram')
+        # (MACD uses 12-day and 26-day EMAs, so the first 26 points are 0)
         
         # Plot MACD and Signal lines
-        ax_macd.plot(plot_data['day'], plot_data['MACD'], 
+        ax_macd.plot(days, macd, 
                     color='#2E86AB', linewidth=1.5, label='MACD Line')
-        ax_macd.plot(plot_data['day'], plot_data['MACD_Signal'], 
+        ax_macd.plot(days, signal, 
                     color='#A23B72', linewidth=1.5, label='Signal Line')
+        
+        # Plot MACD histogram (drawn below the lines by zorder; added last so
+        # it stays last in the legend)
+        hist_colors = _DOWN_UP_RGBA[(hist > 0).astype(np.intp)]
+        _add_bars(ax_macd, days, hist, hist_colors, alpha=0.5, label='MACD Histogram',
+                  antialiased=False)
         ax_macd.axhline(y=0, color='black', linestyle='-', linewidth=0.5, alpha=0.5)
         
         ax_macd.set_ylabel('MACD', fontsize=10, fontweight='bold')
@@ -449,20 +1072,16 @@ class StockVisualizer:
         ax_macd.grid(True, alpha=0.3, linestyle='--')
         ax_macd.tick_params(labelsize=9)
         
-        plt.tight_layout()
-        
         # Convert to base64
-        buf = io.BytesIO()
-        plt.savefig(buf, format='png', dpi=100, bbox_inches='tight')
-        plt.close(fig)
-        buf.seek(0)
-        img_base64 = base64.b64encode(buf.read()).decode('utf-8')
+        img_data = _encode_image(fig, self.image_format)
         
-        return f"data:image/png;base64,{img_base64}"
+        return img_data
 
+    @_cached_chart
     def create_backtested_forecast_chart(self, symbol: str, hist_data: pd.DataFrame,
                                          forecast_days: int = 14,
-                                         num_past_forecasts: int = 5) -> Optional[str]:
+                                         num_past_forecasts: int = 5,
+                                         dpi: Optional[int] = None) -> Optional[str]:
         """
         Create a chart showing past forecast cones overlaid on price history to demonstrate
         prediction confidence. Each historical forecast is colored green if the actual price
@@ -478,9 +1097,10 @@ class StockVisualizer:
             hist_data: Historical OHLCV data (needs at least 2×forecast_days + 20 rows)
             forecast_days: Length of each forecast window in trading days
             num_past_forecasts: How many historical forecast windows to overlay
+            dpi: Render resolution override (e.g. 150 for report export)
 
         Returns:
-            Base64-encoded PNG image or None if matplotlib / data not available
+            Base64-encoded image or None if matplotlib / data not available
         """
         if not self.has_matplotlib or hist_data is None or hist_data.empty:
             return None
@@ -489,17 +1109,17 @@ class StockVisualizer:
         if len(hist_data) < min_rows:
             return None
 
-        from price_predictor import PricePredictor
-        predictor = PricePredictor(forecast_days=forecast_days)
+        predictor = _get_predictor(forecast_days)
 
-        fig, ax = plt.subplots(figsize=(12, 5))
+        fig, ax = self._get_figure('backtested_forecast', lambda: _new_figure((12, 5)),
+                                   dpi, _LARGE_CHART_DPI)
 
-        # Build a numeric day-index for the full history
-        full_data = hist_data.copy()
-        full_data['day'] = range(len(full_data))
+        # Numeric day-index for the full history (bar i is day i)
+        closes = hist_data['Close'].to_numpy()
+        days = np.arange(closes.size)
 
         # Plot the full price history as a thin line
-        ax.plot(full_data['day'], full_data['Close'],
+        ax.plot(days, closes,
                 color='#2E86AB', linewidth=1.5, label='Price History', zorder=2)
 
         # ------------------------------------------------------------------ #
@@ -507,7 +1127,7 @@ class StockVisualizer:
         # ------------------------------------------------------------------ #
         step = max(1, forecast_days)  # advance by one full forecast window at a time
         # Signal indices: evenly spaced, ending before the last window
-        last_signal_idx = len(full_data) - forecast_days - 1
+        last_signal_idx = closes.size - forecast_days - 1
         signal_indices = []
         idx = last_signal_idx
         while idx >= 20 and len(signal_indices) < num_past_forecasts:
@@ -515,99 +1135,84 @@ class StockVisualizer:
             idx -= step
         signal_indices.reverse()  # chronological order
 
-        correct_patch = None
-        incorrect_patch = None
-
-        for sig_idx in signal_indices:
-            signal_day = int(full_data['day'].iloc[sig_idx])
-            signal_price = float(full_data['Close'].iloc[sig_idx])
-
-            # Predict using only data available up to the signal point
-            hist_slice = hist_data.iloc[:sig_idx + 1].copy()
-            pred = predictor.predict_price_range(symbol, signal_price, hist_slice)
+        # Predict every window (plus the forward forecast from the last bar) in
+        # one pass; each uses only data available up to its signal point
+        last_day = closes.size - 1
+        preds = predictor.predict_price_range_batch(hist_data, signal_indices + [last_day])
 
-            conf_low = pred.get('confidence_80_low', signal_price * (1 - _DEFAULT_CONF_BAND))
-            conf_high = pred.get('confidence_80_high', signal_price * (1 + _DEFAULT_CONF_BAND))
-            predicted_price = pred.get('predicted_price', signal_price)
+        # Draw all past windows as one collection per artist type instead of
+        # a fill, line and marker per window
+        sig_arr = np.asarray(signal_indices, dtype=np.intp)
+        exit_arr = sig_arr + forecast_days  # actual exit forecast_days bars after signal
+        valid = exit_arr < closes.size
+        sig_arr, exit_arr = sig_arr[valid], exit_arr[valid]
+        signal_prices = closes[sig_arr]
+        exit_prices = closes[exit_arr]
+        conf_low = preds['confidence_80_low'][:-1][valid]
+        conf_high = preds['confidence_80_high'][:-1][valid]
+        predicted = preds['predicted_price'][:-1][valid]
 
-            # Actual exit price (forecast_days bars after signal)
-            exit_idx = sig_idx + forecast_days
-            if exit_idx >= len(full_data):
-                continue
-            exit_price = float(full_data['Close'].iloc[exit_idx])
-            exit_day = int(full_data['day'].iloc[exit_idx])
+        # Colour logic: green = exit inside 80% confidence band, red = outside
+        hits = (conf_low <= exit_prices) & (exit_prices <= conf_high)
+        cone_colors = _DOWN_UP_RGBA[hits.astype(np.intp)]
 
-            # Colour logic: green = exit inside 80% confidence band, red = outside
-            hit = conf_low <= exit_price <= conf_high
-            cone_color = '#06A77D' if hit else '#D62839'  # green or red
-
-            forecast_x = [signal_day, exit_day]
-
-            # Draw the confidence cone
-            fill = ax.fill_between(
-                forecast_x,
-                [signal_price, conf_low],
-                [signal_price, conf_high],
-                alpha=0.25, color=cone_color, zorder=3
-            )
-            # Draw the centre prediction line
-            ax.plot(forecast_x, [signal_price, predicted_price],
-                    color=cone_color, linewidth=1.5, linestyle='--',
-                    alpha=0.8, zorder=4)
-            # Mark the exit point
-            ax.scatter([exit_day], [exit_price],
-                       color=cone_color, s=50, zorder=5)
-
-            if hit and correct_patch is None:
-                correct_patch = fill
-            if not hit and incorrect_patch is None:
-                incorrect_patch = fill
+        if sig_arr.size:
+            # Confidence cones
+            cones = np.stack([np.column_stack([sig_arr, signal_prices]),
+                              np.column_stack([exit_arr, conf_low]),
+                              np.column_stack([exit_arr, conf_high])], axis=1)
+            ax.add_collection(PolyCollection(cones, color=cone_colors,
+                                             alpha=0.25, zorder=3))
+            # Centre prediction lines
+            centres = np.stack([np.column_stack([sig_arr, signal_prices]),
+                                np.column_stack([exit_arr, predicted])], axis=1)
+            ax.add_collection(LineCollection(centres, colors=cone_colors, linewidths=1.5,
+                                             linestyles='--', alpha=0.8, zorder=4))
+            # Exit points
+            ax.scatter(exit_arr, exit_prices, color=cone_colors, s=50, zorder=5)
+            ax.autoscale_view()
 
         # ------------------------------------------------------------------ #
         # Forward forecast (current / future) in purple
         # ------------------------------------------------------------------ #
-        last_idx = len(full_data) - 1
-        last_day = int(full_data['day'].iloc[last_idx])
-        current_price = float(full_data['Close'].iloc[last_idx])
-        fwd_pred = predictor.predict_price_range(symbol, current_price, hist_data)
-        fwd_conf_low = fwd_pred.get('confidence_80_low', current_price * (1 - _DEFAULT_CONF_BAND))
-        fwd_conf_high = fwd_pred.get('confidence_80_high', current_price * (1 + _DEFAULT_CONF_BAND))
-        fwd_predicted = fwd_pred.get('predicted_price', current_price)
-
-        fwd_x = [last_day, last_day + forecast_days]
+        current_price = float(closes[last_day])
+        fwd_conf_low = preds['confidence_80_low'][-1]
+        fwd_conf_high = preds['confidence_80_high'][-1]
+        fwd_predicted = preds['predicted_price'][-1]
+
+        fwd_x = (last_day, last_day + forecast_days)
         ax.fill_between(fwd_x,
                         [current_price, fwd_conf_low],
                         [current_price, fwd_conf_high],
                         alpha=0.3, color='#A23B72', zorder=3)
         ax.plot(fwd_x, [current_price, fwd_predicted],
                 color='#A23B72', linewidth=2, linestyle='--', zorder=4,
-                label=f'Current Forecast (${fwd_predicted:.2f})')
+                label=rf'Current Forecast (\${fwd_predicted:.2f})')
         ax.scatter([last_day], [current_price],
                    color='#A23B72', s=80, zorder=6,
-                   label=f'Today: ${current_price:.2f}')
+                   label=rf'Today: \${current_price:.2f}')
 
         # ------------------------------------------------------------------ #
         # Legend and formatting
         # ------------------------------------------------------------------ #
         # Build proxy artists for the coloured cones
-        import matplotlib.patches as mpatches
         legend_handles = [
             ax.get_lines()[0],  # price history line
         ]
-        if correct_patch is not None:
+        if hits.any():
             legend_handles.append(
-                mpatches.Patch(color='#06A77D', alpha=0.5, label='Forecast Hit (within 80% band)')
+                Patch(color='#06A77D', alpha=0.5, label='Forecast Hit (within 80% band)')
             )
-        if incorrect_patch is not None:
+        if not hits.all():
             legend_handles.append(
-                mpatches.Patch(color='#D62839', alpha=0.5, label='Forecast Miss (outside 80% band)')
+                Patch(color='#D62839', alpha=0.5, label='Forecast Miss (outside 80% band)')
             )
         legend_handles.append(
-            mpatches.Patch(color='#A23B72', alpha=0.4, label='Current Forecast (80% band)')
+            Patch(color='#A23B72', alpha=0.4, label='Current Forecast (80% band)')
         )
 
         ax.set_xlabel('Trading Day Index', fontsize=9)
-        ax.set_ylabel('Price ($)', fontsize=9)
+        ax.set_ylabel('Price ($)', fontsize=9, parse_math=False)
         ax.set_title(
             f'{symbol} — Backtested Forecast Accuracy ({num_past_forecasts} windows × {forecast_days} days)',
             fontsize=10, fontweight='bold'
@@ -616,18 +1221,14 @@ class StockVisualizer:
         ax.grid(True, alpha=0.3, linestyle='--')
         ax.tick_params(labelsize=8)
 
-        plt.tight_layout()
-
-        buf = io.BytesIO()
-        plt.savefig(buf, format='png', dpi=100, bbox_inches='tight')
-        plt.close(fig)
-        buf.seek(0)
-        img_base64 = base64.b64encode(buf.read()).decode('utf-8')
-        return f"data:image/png;base64,{img_base64}"
+        img_data = _encode_image(fig, self.image_format)
+        return img_data
 
+    @_cached_chart
     def create_full_analysis_chart(self, symbol: str, score_data: Dict,
                                    prediction: Dict, tech_score_data: Dict,
-                                   hist_data: Optional[pd.DataFrame] = None) -> Optional[str]:
+                                   hist_data: Optional[pd.DataFrame] = None,
+                                   dpi: Optional[int] = None) -> Optional[str]:
         """
         Create a unified chart combining price forecast, technical indicators,
         volume, RSI, MACD, and indicator score breakdown in a single image.
@@ -638,37 +1239,31 @@ class StockVisualizer:
             prediction: Price prediction dictionary
             tech_score_data: Score data dict with support_resistance and indicators
             hist_data: Historical OHLCV data
+            dpi: Render resolution override (e.g. 150 for report export)
 
         Returns:
-            Base64-encoded PNG image or None if matplotlib not available
+            Base64-encoded image or None if matplotlib not available
         """
         if not self.has_matplotlib or hist_data is None or hist_data.empty:
             return None
 
-        scorer = _StockScorer() if _HAS_SCORER else None
+        # Use last 60 days for technical panels, as raw arrays
+        tail = hist_data.iloc[-60:]
+        closes, vols = _close_volume(tail)
+        days = np.arange(len(closes))
+        rsi, macd, signal, hist = _indicator_series(tail['Close'])
 
-        # Use last 60 days for technical panels
-        plot_data = hist_data.tail(60).copy()
-        plot_data['day'] = range(len(plot_data))
-
-        # Build figure: 4 rows (price, volume, RSI, MACD) + right column for scores
-        fig = plt.figure(figsize=(16, 12))
-        gs = fig.add_gridspec(4, 2, width_ratios=[3, 1],
-                              height_ratios=[3, 1, 1, 1], hspace=0.35, wspace=0.3)
-
-        ax_price = fig.add_subplot(gs[0, 0])
-        ax_volume = fig.add_subplot(gs[1, 0], sharex=ax_price)
-        ax_rsi = fig.add_subplot(gs[2, 0], sharex=ax_price)
-        ax_macd = fig.add_subplot(gs[3, 0], sharex=ax_price)
-        ax_scores = fig.add_subplot(gs[:, 1])  # spans all 4 rows
+        # Reuse figure: 4 rows (price, volume, RSI, MACD) + right column for scores
+        fig, (ax_price, ax_volume, ax_rsi, ax_macd, ax_scores) = self._get_figure(
+            'full_analysis', self._new_full_analysis_figure, dpi, _LARGE_CHART_DPI)
 
         # --- Price panel: history + forecast + support/resistance ---
-        current_price = prediction.get('current_price', plot_data['Close'].iloc[-1])
+        current_price = prediction.get('current_price', closes[-1])
         predicted_price = prediction.get('predicted_price', current_price)
         forecast_days = prediction.get('forecast_days', 14)
 
         # Historical price
-        ax_price.plot(plot_data['day'], plot_data['Close'],
+        ax_price.plot(days, closes,
                       color='#2E86AB', linewidth=2, label='Price')
 
         # Support and resistance
@@ -677,14 +1272,14 @@ class StockVisualizer:
         resistance = support_resistance.get('resistance', 0)
         if support > 0:
             ax_price.axhline(y=support, color='#06A77D', linestyle='--',
-                             linewidth=1.5, alpha=0.7, label=f'Support: ${support:.2f}')
+                             linewidth=1.5, alpha=0.7, label=rf'Support: \${support:.2f}')
         if resistance > 0:
             ax_price.axhline(y=resistance, color='#D62839', linestyle='--',
-                             linewidth=1.5, alpha=0.7, label=f'Resistance: ${resistance:.2f}')
+                             linewidth=1.5, alpha=0.7, label=rf'Resistance: \${resistance:.2f}')
 
         # Forecast
-        last_day = plot_data['day'].iloc[-1]
-        forecast_x = [last_day, last_day + forecast_days]
+        last_day = days[-1]
+        forecast_x = (last_day, last_day + forecast_days)
         conf_low = prediction.get('confidence_80_low', current_price * 0.97)
         conf_high = prediction.get('confidence_80_high', current_price * 1.03)
         ax_price.plot(forecast_x, [current_price, predicted_price],
@@ -693,9 +1288,9 @@ class StockVisualizer:
                               [current_price, conf_high],
                               alpha=0.25, color='#A23B72', label='80% Conf.')
         ax_price.scatter([last_day], [current_price],
-                         color='#A23B72', s=80, zorder=5, label=f'Current: ${current_price:.2f}')
+                         color='#A23B72', s=80, zorder=5, label=rf'Current: \${current_price:.2f}')
 
-        ax_price.set_ylabel('Price ($)', fontsize=10, fontweight='bold')
+        ax_price.set_ylabel('Price ($)', fontsize=10, fontweight='bold', parse_math=False)
         ax_price.set_title(f'{symbol} — Technical Analysis & Price Forecast',
                            fontsize=12, fontweight='bold')
         ax_price.legend(loc='upper left', fontsize=7)
@@ -703,35 +1298,29 @@ class StockVisualizer:
         ax_price.tick_params(labelsize=9)
 
         # --- Volume panel ---
-        avg_volume = plot_data['Volume'].mean()
-        vol_colors = ['#D62839' if v >= avg_volume * 1.5 else '#2E86AB'
-                      for v in plot_data['Volume']]
-        ax_volume.bar(plot_data['day'], plot_data['Volume'],
-                      color=vol_colors, alpha=0.7, width=0.8)
-        ax_volume.axhline(y=avg_volume * 1.5, color='#D62839', linestyle='--',
+        spike_volume = vols.mean() * 1.5
+        vol_colors = _VOLUME_RGBA[(vols >= spike_volume).astype(np.intp)]
+        _add_bars(ax_volume, days, vols, vol_colors, alpha=0.7,
+                  antialiased=False)
+        ax_volume.axhline(y=spike_volume, color='#D62839', linestyle='--',
                           linewidth=1.2, alpha=0.5, label='1.5× Avg Vol')
         ax_volume.set_ylabel('Volume', fontsize=9, fontweight='bold')
         ax_volume.legend(loc='upper left', fontsize=7)
         ax_volume.grid(True, alpha=0.3, linestyle='--', axis='y')
+        ax_volume.grid(False, axis='x')
         ax_volume.tick_params(labelsize=8)
         ax_volume.ticklabel_format(style='plain', axis='y')
 
         # --- RSI panel ---
-        rsi_values = []
-        for i in range(len(plot_data)):
-            if i < 14:
-                rsi_values.append(50)
-            else:
-                rsi_val = scorer.calculate_rsi(plot_data['Close'].iloc[:i + 1], period=14)
-                rsi_values.append(rsi_val)
-        plot_data['RSI'] = rsi_values
-
-        ax_rsi.plot(plot_data['day'], plot_data['RSI'],
+        # First 14 points use 50 as neutral midpoint
+        ax_rsi.plot(days, rsi,
                     color='#A23B72', linewidth=2, label='RSI')
         ax_rsi.axhline(y=70, color='#D62839', linestyle='--', linewidth=1, alpha=0.5)
         ax_rsi.axhline(y=30, color='#06A77D', linestyle='--', linewidth=1, alpha=0.5)
-        ax_rsi.fill_between(plot_data['day'], 70, 100, alpha=0.1, color='#D62839', label='Overbought')
-        ax_rsi.fill_between(plot_data['day'], 0, 30, alpha=0.1, color='#06A77D', label='Oversold')
+        ax_rsi.fill_between(days, 70, 100, alpha=0.1, color='#D62839', label='Overbought',
+                            antialiased=False)
+        ax_rsi.fill_between(days, 0, 30, alpha=0.1, color='#06A77D', label='Oversold',
+                            antialiased=False)
         ax_rsi.set_ylabel('RSI', fontsize=9, fontweight='bold')
         ax_rsi.set_ylim(0, 100)
         ax_rsi.legend(loc='upper left', fontsize=7)
@@ -739,29 +1328,14 @@ class StockVisualizer:
         ax_rsi.tick_params(labelsize=8)
 
         # --- MACD panel ---
-        macd_vals, signal_vals, hist_vals = [], [], []
-        for i in range(len(plot_data)):
-            if i < 26:
-                macd_vals.append(0)
-                signal_vals.append(0)
-                hist_vals.append(0)
-            else:
-                m, s, h = scorer.calculate_macd(plot_data['Close'].iloc[:i + 1])
-                macd_vals.append(m)
-                signal_vals.append(s)
-                hist_vals.append(h)
-
-        plot_data['MACD'] = macd_vals
-        plot_data['MACD_Signal'] = signal_vals
-        plot_data['MACD_Hist'] = hist_vals
-
-        hist_colors = ['#06A77D' if h > 0 else '#D62839' for h in plot_data['MACD_Hist']]
-        ax_macd.bar(plot_data['day'], plot_data['MACD_Hist'],
-                    color=hist_colors, alpha=0.5, width=0.8, label='Histogram')
-        ax_macd.plot(plot_data['day'], plot_data['MACD'],
+        # First 26 points are 0 until the 26-day EMA has enough data
+        ax_macd.plot(days, macd,
                      color='#2E86AB', linewidth=1.5, label='MACD')
-        ax_macd.plot(plot_data['day'], plot_data['MACD_Signal'],
+        ax_macd.plot(days, signal,
                      color='#A23B72', linewidth=1.5, label='Signal')
+        hist_colors = _DOWN_UP_RGBA[(hist > 0).astype(np.intp)]
+        _add_bars(ax_macd, days, hist, hist_colors, alpha=0.5, label='Histogram',
+                  antialiased=False)
         ax_macd.axhline(y=0, color='black', linestyle='-', linewidth=0.5, alpha=0.5)
         ax_macd.set_ylabel('MACD', fontsize=9, fontweight='bold')
         ax_macd.set_xlabel('Days', fontsize=9, fontweight='bold')
@@ -774,32 +1348,27 @@ class StockVisualizer:
         if score_contributions:
             labels = [k.replace('_score', '').replace('_', ' ').title()
                       for k in score_contributions]
-            values = list(score_contributions.values())
-            colors = ['#06A77D' if v >= 75 else '#F5B700' if v >= 50 else '#D62839'
-                      for v in values]
+            values = np.fromiter(score_contributions.values(), dtype=np.float64,
+                                 count=len(score_contributions))
+            colors = _SCORE_PALETTE[np.digitize(values, _SCORE_BINS)].tolist()
             y_pos = np.arange(len(labels))
-            ax_scores.barh(y_pos, values, color=colors, alpha=0.8)
+            bars = ax_scores.barh(y_pos, values, color=colors, alpha=0.8)
             ax_scores.set_yticks(y_pos)
             ax_scores.set_yticklabels(labels, fontsize=9)
             ax_scores.set_xlabel('Score (0-100)', fontsize=9)
             ax_scores.set_xlim(0, 100)
+            ax_scores.xaxis.set_major_locator(FixedLocator(_SCORE_TICKS))
             ax_scores.set_title('Indicator Scores', fontsize=10, fontweight='bold')
             ax_scores.grid(True, axis='x', alpha=0.3, linestyle='--')
+            ax_scores.grid(False, axis='y')
             ax_scores.tick_params(labelsize=8)
-            for i, v in enumerate(values):
-                ax_scores.text(v + 2, i, f'{v:.1f}', va='center', fontsize=8, fontweight='bold')
+            ax_scores.bar_label(bars, fmt='%.1f', padding=5, fontsize=8, fontweight='bold')
         else:
             ax_scores.text(0.5, 0.5, 'No score data', ha='center', va='center',
                            transform=ax_scores.transAxes, fontsize=10)
             ax_scores.set_title('Indicator Scores', fontsize=10, fontweight='bold')
+            ax_scores.grid(False)
 
-        fig.subplots_adjust(left=0.07, right=0.97, top=0.95, bottom=0.08,
-                            hspace=0.35, wspace=0.3)
-
-        buf = io.BytesIO()
-        plt.savefig(buf, format='png', dpi=100, bbox_inches='tight')
-        plt.close(fig)
-        buf.seek(0)
-        img_base64 = base64.b64encode(buf.read()).decode('utf-8')
+        img_data = _encode_image(fig, self.image_format)
 
-        return f"data:image/png;base64,{img_base64}"
+        return img_data
@@ -5,7 +5,9 @@ Tests support/resistance, breakout filters, and technical analysis charts
 """
 import sys
 import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src')
+if SRC_DIR not in sys.path:  # conftest.py already adds it under pytest
+    sys.path.insert(0, SRC_DIR)
 
 from scoring_system import StockScorer
 from visualizations import StockVisualizer
@@ -5,10 +5,13 @@ Tests support/resistance, breakout filters, and technical analysis with syntheti
 """
 import sys
 import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src')
+if SRC_DIR not in sys.path:  # conftest.py already adds it under pytest
+    sys.path.insert(0, SRC_DIR)
 
 from scoring_system import StockScorer
-from visualizations import StockVisualizer
+from visualizations import StockVisualizer, _chart_cache, _panel_cache
+from price_predictor import PricePredictor
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
@@ -19,18 +22,19 @@ def create_mock_stock_data(days=120, base_price=100, volatility=0.02):
     dates = pd.date_range(end=datetime.now(), periods=days, freq='D')
     
     # Generate price data with random walk
-    np.random.seed(42)
-    returns = np.random.normal(0, volatility, days)
+    rng = np.random.default_rng(42)
+    returns = rng.normal(0, volatility, days)
     prices = base_price * np.exp(np.cumsum(returns))
     
-    # Create OHLCV data
+    # Create OHLCV data (one draw for the Open/High/Low offsets)
+    offsets = rng.uniform(-1, 1, size=(3, days))
     data = pd.DataFrame({
-        'Open': prices * (1 + np.random.uniform(-0.01, 0.01, days)),
-        'High': prices * (1 + np.random.uniform(0, 0.02, days)),
-        'Low': prices * (1 - np.random.uniform(0, 0.02, days)),
+        'Open': prices * (1 + 0.01 * offsets[0]),
+        'High': prices * (1 + 0.02 * np.abs(offsets[1])),
+        'Low': prices * (1 - 0.02 * np.abs(offsets[2])),
         'Close': prices,
-        'Volume': np.random.randint(1000000, 10000000, days)
-    }, index=dates)
+        'Volume': rng.integers(1000000, 10000000, days)
+    }, index=dates, copy=False)
     
     return data
 
@@ -89,7 +93,7 @@ def test_breakout_filters_with_mock_data():
     # Simulate volume spike in recent days - boost it more
     # Use 2.5x to ensure we exceed the 1.5x threshold with margin
     MOCK_VOLUME_SPIKE_MULTIPLIER = 2.5
-    hist.loc[hist.index[-1:], 'Volume'] = hist['Volume'].iloc[-20:].mean() * MOCK_VOLUME_SPIKE_MULTIPLIER
+    hist.loc[hist.index[-1:], 'Volume'] = int(hist['Volume'].iloc[-20:].mean() * MOCK_VOLUME_SPIKE_MULTIPLIER)
     
     current_price = hist['Close'].iloc[-1]
     
@@ -295,6 +299,246 @@ def test_backtested_forecast_chart_with_mock_data():
     return True
 
 
+def test_indicator_series_match_scalar_with_mock_data():
+    """Test vectorized indicator series match the per-bar scalar calculations"""
+    print("\n" + "=" * 60)
+    print("TEST 6: Vectorized Indicator Series (Mock Data)")
+    print("=" * 60)
+
+    scorer = StockScorer(lookback_days=120, forecast_days=14)
+    prices = create_mock_stock_data(days=60, base_price=150)['Close']
+
+    rsi_series = scorer.calculate_rsi_series(prices, period=14)
+    expected_rsi = [50.0 if i < 14 else scorer.calculate_rsi(prices.iloc[:i + 1], period=14)
+                    for i in range(len(prices))]
+
+    print(f"\n  Data points: {len(prices)}")
+    print(f"  Last RSI (series): {rsi_series.iloc[-1]:.2f}")
+
+    assert len(rsi_series) == len(prices), "RSI series should cover every bar"
+    assert np.allclose(rsi_series.to_numpy(), expected_rsi), "RSI series should match per-bar RSI"
+    assert (rsi_series.iloc[:14] == 50.0).all(), "Warm-up bars should be neutral (50)"
+
+    macd, signal, histogram = scorer.calculate_macd_series(prices)
+    expected_macd = np.array([(0.0, 0.0, 0.0) if i < 26 else scorer.calculate_macd(prices.iloc[:i + 1])
+                              for i in range(len(prices))])
+
+    print(f"  Last MACD Histogram (series): {histogram.iloc[-1]:.4f}")
+
+    assert np.allclose(np.column_stack([macd, signal, histogram]), expected_macd), \
+        "MACD series should match per-bar MACD"
+
+    print("\n✓ Vectorized indicator series test PASSED")
+    return True
+
+
+def test_batch_prediction_matches_scalar_with_mock_data():
+    """Test batch price predictions match per-slice predict_price_range calls"""
+    print("\n" + "=" * 60)
+    print("TEST 7: Batch Price Prediction (Mock Data)")
+    print("=" * 60)
+
+    predictor = PricePredictor(forecast_days=14)
+    hist = create_mock_stock_data(days=120, base_price=150)
+    end_indices = [10, 25, 40, 75, len(hist) - 1]  # covers the <20 and <30 bar fallbacks
+
+    batch = predictor.predict_price_range_batch(hist, end_indices)
+
+    print(f"\n  Prediction points: {len(end_indices)}")
+    print(f"  Last predicted price (batch): ${batch['predicted_price'][-1]:.2f}")
+
+    for k, i in enumerate(end_indices):
+        expected = predictor.predict_price_range('MOCK', float(hist['Close'].iloc[i]), hist.iloc[:i + 1])
+        for key, values in batch.items():
+            assert np.isclose(values[k], expected[key]), f"{key} at bar {i} should match per-slice prediction"
+
+    # A history shorter than the 20-bar trend window only gets fallbacks
+    short = hist.iloc[:15]
+    short_batch = predictor.predict_price_range_batch(short, [5, len(short) - 1])
+    for k, i in enumerate([5, len(short) - 1]):
+        expected = predictor.predict_price_range('MOCK', float(short['Close'].iloc[i]), short.iloc[:i + 1])
+        for key, values in short_batch.items():
+            assert np.isclose(values[k], expected[key]), f"{key} at short bar {i} should match per-slice prediction"
+
+    print("\n✓ Batch prediction test PASSED")
+    return True
+
+
+def test_chart_cache_with_mock_data():
+    """Test repeated chart requests are served from the rendered-chart cache"""
+    print("\n" + "=" * 60)
+    print("TEST 8: Rendered Chart Cache (Mock Data)")
+    print("=" * 60)
+
+    # Start from empty LRUs so earlier renders cannot evict entries or cap
+    # the panel count measured below
+    _chart_cache.clear()
+    _panel_cache.clear()
+
+    hist = create_mock_stock_data(days=120, base_price=150)
+    score_data = {'score_contributions': {'rsi_score': 62.5, 'macd_score': 80.0}}
+
+    first = StockVisualizer().create_technical_analysis_chart('MOCK', score_data, hist.copy())
+    repeat = StockVisualizer().create_technical_analysis_chart('MOCK', score_data, hist.copy())
+
+    changed = hist.copy()
+    changed.iloc[-1, changed.columns.get_loc('Close')] *= 1.05
+    updated = StockVisualizer().create_technical_analysis_chart('MOCK', score_data, changed)
+
+    # Row hashes ignore labels, so swapped columns must still miss the cache
+    relabeled = StockVisualizer().create_technical_analysis_chart(
+        'MOCK', score_data, hist.rename(columns={'High': 'Low', 'Low': 'High'}))
+
+    noisy = {'score_contributions': {'rsi_score': 62.5 + 1e-9, 'macd_score': 80.0}}
+    rounded = StockVisualizer().create_technical_analysis_chart('MOCK', noisy, hist)
+
+    # A price-only refresh of the combined chart redraws just the forecast half
+    prediction = {'current_price': 150.0, 'predicted_price': 155.0, 'forecast_days': 14}
+    before = StockVisualizer().create_combined_chart('MOCK', score_data, prediction, hist)
+    panels = len(_panel_cache)
+    refreshed = StockVisualizer().create_combined_chart(
+        'MOCK', score_data, dict(prediction, predicted_price=158.0), hist)
+    new_panels = len(_panel_cache) - panels
+
+    print(f"\n  Repeat served from cache: {repeat is first}")
+    print(f"  Float noise served from cache: {rounded is first}")
+    print(f"  Changed data re-rendered: {updated != first}")
+    print(f"  Relabeled columns re-rendered: {relabeled is not first}")
+    print(f"  Panels redrawn on price refresh: {new_panels}")
+
+    assert repeat is first, "Identical inputs should return the cached chart"
+    assert rounded is first, "Scores equal to 4 decimals should share a cache entry"
+    assert updated != first, "Changed history should produce a new chart"
+    assert relabeled is not first, "Column labels should be part of the cache key"
+    assert refreshed != before, "Changed prediction should produce a new combined chart"
+    assert new_panels == 1, "Unchanged scores should reuse the cached scores panel"
+
+    print("\n✓ Chart cache test PASSED")
+    return True
+
+
+def test_short_history_placeholder_with_mock_data():
+    """Test histories shorter than the indicator warm-up get a shared placeholder"""
+    print("\n" + "=" * 60)
+    print("TEST 9: Short History Placeholder (Mock Data)")
+    print("=" * 60)
+
+    short = create_mock_stock_data(days=20, base_price=50)
+    first = StockVisualizer().create_technical_analysis_chart('IPO1', {}, short)
+    second = StockVisualizer().create_technical_analysis_chart('IPO2', {}, short.iloc[5:])
+    full = StockVisualizer().create_technical_analysis_chart('MOCK', {}, create_mock_stock_data(days=120))
+
+    print(f"\n  Placeholder size: {len(first)} characters")
+    print(f"  Shared across symbols: {second is first}")
+
+    assert first.startswith('data:image/png;base64,'), "Placeholder should be a PNG data URI"
+    assert second is first, "Short histories should reuse the same placeholder"
+    assert len(full) > len(first), "Full technical chart should be rendered for long histories"
+
+    print("\n✓ Short history placeholder test PASSED")
+    return True
+
+
+def test_pyplot_style_during_render_with_mock_data():
+    """Test pyplot figures built while a chart renders keep the process rcParams"""
+    print("\n" + "=" * 60)
+    print("TEST 10: pyplot Style During Chart Render (Mock Data)")
+    print("=" * 60)
+
+    import threading
+    import matplotlib
+    import matplotlib.pyplot as plt
+    from matplotlib.font_manager import FontProperties
+
+    hist = create_mock_stock_data(days=120, base_price=150)
+    prediction = {'current_price': 150.0, 'predicted_price': 155.0, 'forecast_days': 14}
+    visualizer = StockVisualizer()
+    visualizer.create_indicator_breakdown_chart('MOCK', {'score_contributions': {'rsi_score': 1.0}})
+    plt.close(plt.figure())  # resolve the pyplot backend before the snapshot
+    expected = dict(matplotlib.rcParams)
+
+    done = threading.Event()
+    renders = []
+
+    def render():
+        while not done.is_set():
+            # A new score per call, so every call misses the chart cache
+            score_data = {'score_contributions': {'rsi_score': float(len(renders) % 100)}}
+            visualizer.create_indicator_breakdown_chart('MOCK', score_data)
+            visualizer.create_combined_chart('MOCK', score_data, prediction, hist)
+            renders.append(1)
+
+    worker = threading.Thread(target=render)
+    worker.start()
+    try:
+        # pyplot figures as combined_top5 builds them, until several renders overlapped
+        title_size = FontProperties(size=expected['axes.titlesize']).get_size_in_points()
+        changed = set()
+        checks = 0
+        while checks < 20 or len(renders) < 3:
+            fig, ax = plt.subplots()
+            title = ax.set_title('Top 5 ($)')
+            changed |= {key for key, value in matplotlib.rcParams.items()
+                        if expected.get(key) != value}
+            assert title.get_fontsize() == title_size, "Title should use the pyplot font size"
+            assert ax.xaxis.get_gridlines()[0].get_visible() == expected['axes.grid'], \
+                "Grid should follow the pyplot rcParams"
+            plt.close(fig)
+            checks += 1
+    finally:
+        done.set()
+        worker.join()
+
+    print(f"\n  pyplot figures built: {checks}")
+    print(f"  Chart renders during the check: {len(renders)}")
+    print(f"  rcParams changed: {sorted(changed) or 'none'}")
+
+    assert renders, "Charts should have rendered while pyplot figures were built"
+    assert not changed, f"Chart rendering changed global rcParams: {sorted(changed)}"
+
+    print("\n✓ pyplot style test PASSED")
+    return True
+
+
+def test_macd_kernel_matches_pandas_with_mock_data():
+    """Test the compiled-EMA MACD path matches the pandas ewm path"""
+    print("\n" + "=" * 60)
+    print("TEST 11: MACD Kernel vs pandas (Mock Data)")
+    print("=" * 60)
+
+    from unittest import mock
+    import scoring_system
+
+    scorer = StockScorer()
+    closes = create_mock_stock_data(days=120, base_price=150)['Close']
+    gapped = closes.copy()
+    gapped.iloc[60] = np.nan  # left to the pandas path's NaN handling
+
+    # numba is optional; run the kernel path uncompiled when it is missing
+    print(f"\n  numba installed: {scoring_system.HAS_NUMBA}")
+    for label, prices in (('clean', closes), ('with NaN', gapped)):
+        with mock.patch.object(scoring_system, 'HAS_NUMBA', False):
+            expected = scorer.calculate_macd(prices)
+            expected_series = scorer.calculate_macd_series(prices)
+        with mock.patch.object(scoring_system, 'HAS_NUMBA', True):
+            kernel_used = scoring_system._macd_arrays(prices) is not None
+            actual = scorer.calculate_macd(prices)
+            actual_series = scorer.calculate_macd_series(prices)
+
+        print(f"  {label}: kernel used: {kernel_used}, MACD {actual[0]:.4f}")
+
+        assert kernel_used == (label == 'clean'), "Only NaN-free prices should use the kernel"
+        for value, reference in zip(actual, expected):
+            assert type(value) is type(reference), "Both paths should return the same scalar type"
+            assert np.isclose(value, reference, rtol=0, atol=1e-10), "Kernel MACD should match pandas"
+        for series, reference in zip(actual_series, expected_series):
+            assert series.index.equals(reference.index), "Series should keep the price index"
+            assert np.allclose(series, reference, rtol=0, atol=1e-10), "Kernel MACD series should match pandas"
+
+    print("\n✓ MACD kernel test PASSED")
+    return True
+
+
 def main():
     """Run all tests"""
     print("\n" + "=" * 60)
@@ -307,6 +551,12 @@ def main():
         test_comprehensive_scoring_with_mock_data,
         test_technical_chart_with_mock_data,
         test_backtested_forecast_chart_with_mock_data,
+        test_indicator_series_match_scalar_with_mock_data,
+        test_batch_prediction_matches_scalar_with_mock_data,
+        test_chart_cache_with_mock_data,
+        test_short_history_placeholder_with_mock_data,
+        test_pyplot_style_during_render_with_mock_data,
+        test_macd_kernel_matches_pandas_with_mock_data,
     ]
     
     results = []
@@ -8,12 +8,24 @@ Tests:
 """
 import sys
 import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src')
+if SRC_DIR not in sys.path:  # conftest.py already adds it under pytest
+    sys.path.insert(0, SRC_DIR)
 
 import pandas as pd
 import numpy as np
 from scoring_system import StockScorer
 
+# Read-only fixtures shared by all tests: the scorer keeps no per-call state,
+# and every mock history is a suffix of the same fixed daily calendar
+SCORER = StockScorer()
+DATES = pd.date_range(end=pd.Timestamp('2024-01-01'), periods=60, freq='D')
+RNG = np.random.default_rng(1234)
+
+# 60-day ramp 100 + 0.5*i with High/Low at +/-2: extremes of the whole window
+EXPECTED_SUPPORT_60 = 98.0
+EXPECTED_RESISTANCE_60 = 131.5
+
 
 def test_support_resistance_not_matching():
     """Test that support and resistance are never identical when data is available"""
@@ -21,17 +33,17 @@ def test_support_resistance_not_matching():
     print("TEST 1: Support/Resistance Should Not Match")
     print("=" * 60)
     
-    scorer = StockScorer()
+    scorer = SCORER
     
     # Create mock historical data with varying prices (50 days)
-    dates = pd.date_range(end=pd.Timestamp.now(), periods=50, freq='D')
-    prices = [100 + i * 0.5 + np.random.random() * 2 for i in range(50)]
+    dates = DATES[-50:]
+    prices = 100 + np.arange(50) * 0.5 + RNG.random(50) * 2
     
     hist_data = pd.DataFrame({
         'Close': prices,
-        'High': [p + 1 for p in prices],
-        'Low': [p - 1 for p in prices],
-        'Volume': [1000000 + np.random.randint(0, 500000) for _ in range(50)]
+        'High': prices + 1,
+        'Low': prices - 1,
+        'Volume': 1000000 + RNG.integers(0, 500000, size=50)
     }, index=dates)
     
     support, resistance, days_used = scorer.calculate_support_resistance(hist_data, period=90)
@@ -67,14 +79,15 @@ def test_minimum_data_requirement():
     print("TEST 2: Minimum Data Requirement (30 days)")
     print("=" * 60)
     
-    scorer = StockScorer()
+    scorer = SCORER
     
     # Test with 29 days (insufficient)
-    dates_29 = pd.date_range(end=pd.Timestamp.now(), periods=29, freq='D')
+    dates_29 = DATES[-29:]
+    steps_29 = np.arange(29)
     hist_29 = pd.DataFrame({
-        'Close': [100 + i for i in range(29)],
-        'High': [101 + i for i in range(29)],
-        'Low': [99 + i for i in range(29)]
+        'Close': 100 + steps_29,
+        'High': 101 + steps_29,
+        'Low': 99 + steps_29
     }, index=dates_29)
     
     support_29, resistance_29, days_29 = scorer.calculate_support_resistance(hist_29, period=90)
@@ -88,11 +101,12 @@ def test_minimum_data_requirement():
         return False
     
     # Test with 30 days (sufficient)
-    dates_30 = pd.date_range(end=pd.Timestamp.now(), periods=30, freq='D')
+    dates_30 = DATES[-30:]
+    steps_30 = np.arange(30)
     hist_30 = pd.DataFrame({
-        'Close': [100 + i for i in range(30)],
-        'High': [101 + i for i in range(30)],
-        'Low': [99 + i for i in range(30)]
+        'Close': 100 + steps_30,
+        'High': 101 + steps_30,
+        'Low': 99 + steps_30
     }, index=dates_30)
     
     support_30, resistance_30, days_30 = scorer.calculate_support_resistance(hist_30, period=90)
@@ -114,7 +128,7 @@ def test_position_filter_75_percent():
     print("TEST 3: Position Filter (40%-75%)")
     print("=" * 60)
     
-    scorer = StockScorer()
+    scorer = SCORER
     
     # Test cases: (current_price, support, resistance, expected_result, description)
     # Formula: relative_pos = (current - support) / (resistance - support)
@@ -163,16 +177,16 @@ def test_uses_available_data():
     print("TEST 4: Uses Available Data (< 90 days but >= 30)")
     print("=" * 60)
     
-    scorer = StockScorer()
+    scorer = SCORER
     
     # Create 60 days of data (less than 90 but more than 30)
-    dates = pd.date_range(end=pd.Timestamp.now(), periods=60, freq='D')
-    prices = [100 + i * 0.5 for i in range(60)]
+    dates = DATES
+    prices = 100 + np.arange(60) * 0.5
     
     hist_data = pd.DataFrame({
         'Close': prices,
-        'High': [p + 2 for p in prices],
-        'Low': [p - 2 for p in prices],
+        'High': prices + 2,
+        'Low': prices - 2,
     }, index=dates)
     
     support, resistance, days_used = scorer.calculate_support_resistance(hist_data, period=90)
@@ -183,8 +197,8 @@ def test_uses_available_data():
     print(f"Resistance: ${resistance:.2f}")
     
     # Should use available data
-    expected_support = min([p - 2 for p in prices])
-    expected_resistance = max([p + 2 for p in prices])
+    expected_support = EXPECTED_SUPPORT_60
+    expected_resistance = EXPECTED_RESISTANCE_60
     
     if abs(support - expected_support) < 0.01 and abs(resistance - expected_resistance) < 0.01 and days_used == 60:
         print(f"✅ PASS: Uses all available 60 days")